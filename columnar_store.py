@@ -0,0 +1,135 @@
+"""Chunked columnar storage for morphic datasets, memory-mapped on read"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class MorphicColumnStore:
+    """
+    Chunked columnar morphic dataset on disk with memory-mapped reads
+    
+    Layout: one .npy file per column per chunk plus a meta.json index of
+    chunk row counts and time bounds; the time column is numeric (e.g. int64
+    epoch ns) and sorted. Opening reads only the index; column
+    data is mapped lazily, so only the slices a caller touches are paged in.
+    """
+    
+    META_NAME = 'meta.json'
+    
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, self.META_NAME)) as handle:
+            self.meta = json.load(handle)
+        self._maps: Dict[Tuple[str, int], np.ndarray] = {}
+    
+    @classmethod
+    def create(cls, path: str, columns: Dict[str, np.ndarray],
+               time_column: str = 'timestamp',
+               chunk_rows: int = 1 << 20) -> 'MorphicColumnStore':
+        """Write columns as a new dataset, split into chunk_rows-row chunks"""
+        if time_column not in columns:
+            raise ValueError(f"Missing time column: {time_column}")
+        os.makedirs(path, exist_ok=False)
+        meta = {
+            'version': 1,
+            'time_column': time_column,
+            'chunk_rows': chunk_rows,
+            'columns': {name: {'dtype': np.asarray(values).dtype.str,
+                               'shape': list(np.shape(values)[1:])}
+                        for name, values in columns.items()},
+            'chunks': []
+        }
+        with open(os.path.join(path, cls.META_NAME), 'w') as handle:
+            json.dump(meta, handle)
+        store = cls(path)
+        store.append(columns)
+        return store
+    
+    @property
+    def length(self) -> int:
+        return sum(chunk['rows'] for chunk in self.meta['chunks'])
+    
+    @property
+    def columns(self) -> List[str]:
+        return list(self.meta['columns'])
+    
+    def append(self, columns: Dict[str, np.ndarray]) -> None:
+        """Add rows as new chunks; time must continue non-decreasing"""
+        if set(columns) != set(self.meta['columns']):
+            raise ValueError("Appended columns must match the dataset schema")
+        rows = {len(values) for values in columns.values()}
+        if len(rows) != 1:
+            raise ValueError("All columns must have the same number of rows")
+        times = np.asarray(columns[self.meta['time_column']])
+        chunks = self.meta['chunks']
+        if times.size and (np.any(np.diff(times) < 0) or
+                           (chunks and times[0] < chunks[-1]['time_max'])):
+            raise ValueError("Time column must be sorted in non-decreasing order")
+        
+        chunk_rows = self.meta['chunk_rows']
+        for start in range(0, rows.pop(), chunk_rows):
+            index = len(chunks)
+            for name, values in columns.items():
+                block = np.asarray(values[start:start + chunk_rows],
+                                   dtype=self.meta['columns'][name]['dtype'])
+                np.save(self._chunk_path(name, index), block)
+            block_times = times[start:start + chunk_rows]
+            chunks.append({'rows': int(block_times.size),
+                           'time_min': block_times[0].item(),
+                           'time_max': block_times[-1].item()})
+        with open(os.path.join(self.path, self.META_NAME), 'w') as handle:
+            json.dump(self.meta, handle)
+    
+    def iter_chunks(self, columns: Optional[List[str]] = None,
+                    time_range: Optional[Tuple[Any, Any]] = None,
+                    max_rows: Optional[int] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Yield column views chunk by chunk, zero-copy from the memory maps
+        
+        Parameters:
+        - columns: Columns to read; all by default
+        - time_range: Inclusive (start, end) bounds on the time column
+        - max_rows: Split stored chunks into pieces of at most this many rows
+        """
+        columns = columns or self.columns
+        unknown = set(columns) - set(self.meta['columns'])
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        for index, chunk in enumerate(self.meta['chunks']):
+            low, high = 0, chunk['rows']
+            if time_range is not None:
+                start_time, end_time = time_range
+                if chunk['time_max'] < start_time or chunk['time_min'] > end_time:
+                    continue
+                times = self._map(self.meta['time_column'], index)
+                low = int(np.searchsorted(times, start_time, side='left'))
+                high = int(np.searchsorted(times, end_time, side='right'))
+            step = max_rows or max(high - low, 1)
+            for start in range(low, high, step):
+                stop = min(start + step, high)
+                yield {name: self._map(name, index)[start:stop] for name in columns}
+    
+    def read(self, columns: Optional[List[str]] = None,
+             time_range: Optional[Tuple[Any, Any]] = None) -> Dict[str, np.ndarray]:
+        """Columns over a time range; a view when it lies within one chunk"""
+        pieces = list(self.iter_chunks(columns, time_range))
+        names = columns or self.columns
+        if len(pieces) == 1:
+            return pieces[0]
+        if not pieces:
+            return {name: np.empty([0] + self.meta['columns'][name]['shape'],
+                                   dtype=self.meta['columns'][name]['dtype'])
+                    for name in names}
+        return {name: np.concatenate([piece[name] for piece in pieces]) for name in names}
+    
+    def _map(self, name: str, index: int) -> np.ndarray:
+        key = (name, index)
+        if key not in self._maps:
+            self._maps[key] = np.load(self._chunk_path(name, index), mmap_mode='r')
+        return self._maps[key]
+    
+    def _chunk_path(self, name: str, index: int) -> str:
+        return os.path.join(self.path, f'{name}.{index:06d}.npy')
@@ -1,3 +1,11 @@
+import asyncio
+import math
+import time
+import numpy as np
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+
 class MorphicFieldVisualizer:
     """Implementation of real-time morphic field visualization system"""
     
@@ -20,15 +28,53 @@ class MorphicFieldVisualizer:
         render_func = self.visualization_modes[mode]
         return render_func(field_data)
     
-    def _render_resonance_field(self, field_data: np.ndarray) -> Dict[str, np.ndarray]:
-        """Render morphic resonance patterns"""
+    def build_pyramid(self, field_data: np.ndarray, max_cached: int = 256) -> 'FieldPyramid':
+        """Wrap a high-resolution field in a cached level-of-detail pyramid"""
+        return FieldPyramid(self, field_data, max_cached)
+    
+    def visualize_all_modes(self, field_data: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Render every visualization mode for one frame
+        
+        Returns:
+        - Mapping of mode name to that mode's visualization dict
+        """
+        field = np.asarray(field_data)
+        return {
+            mode: render_func(field)
+            for mode, render_func in self.visualization_modes.items()
+        }
+    
+    def _compute_shared_intermediates(self, field_data: np.ndarray) -> Dict[str, np.ndarray]:
+        """Intensity and phase maps the resonance renderer derives from a field"""
+        field = np.asarray(field_data)
+        return {
+            'field': field,
+            'intensity': np.abs(field),
+            'phase': np.angle(field)
+        }
+    
+    def _render_resonance_field(self, field_data: np.ndarray,
+                                shared: Optional[Dict[str, np.ndarray]] = None,
+                                out: Optional[Dict[str, np.ndarray]] = None
+                                ) -> Dict[str, np.ndarray]:
+        """
+        Render morphic resonance patterns
+        
+        shared may carry precomputed 'intensity' and 'phase' maps of
+        field_data, and out complex buffers under 'intensity_map' and
+        'phase_map' to render into, as StreamingFieldRenderer reuses.
+        """
         # Transform field data into visual representation
-        field_intensity = np.abs(field_data)
-        phase_data = np.angle(field_data)
+        if shared is None:
+            shared = self._compute_shared_intermediates(field_data)
+        out = out or {}
         
         return {
-            'intensity_map': self._generate_intensity_visualization(field_intensity),
-            'phase_map': self._generate_phase_visualization(phase_data),
+            'intensity_map': self._generate_intensity_visualization(
+                shared['intensity'], out.get('intensity_map')),
+            'phase_map': self._generate_phase_visualization(
+                shared['phase'], out.get('phase_map')),
             'interference_patterns': self._compute_interference_patterns(field_data)
         }
     
@@ -68,10 +114,269 @@ class MorphicFieldVisualizer:
             'coupling_dynamics': self._visualize_coupling_dynamics(field_data)
         }
     
-    def _generate_intensity_visualization(self, intensity_data: np.ndarray) -> np.ndarray:
+    def _generate_intensity_visualization(self, intensity_data: np.ndarray,
+                                          out: Optional[np.ndarray] = None) -> np.ndarray:
         """Generate visual representation of field intensity"""
-        return np.exp(1j * intensity_data) * np.abs(intensity_data)
+        if out is None:
+            return np.exp(1j * intensity_data) * np.abs(intensity_data)
+        # |I| * exp(iI) = |I|cos|I| + i * I*sin|I|, built in out's own planes
+        np.abs(intensity_data, out=out.imag)
+        np.cos(out.imag, out=out.real)
+        np.multiply(out.real, out.imag, out=out.real)
+        np.sin(out.imag, out=out.imag)
+        np.multiply(out.imag, intensity_data, out=out.imag)
+        return out
     
-    def _generate_phase_visualization(self, phase_data: np.ndarray) -> np.ndarray:
+    def _generate_phase_visualization(self, phase_data: np.ndarray,
+                                      out: Optional[np.ndarray] = None) -> np.ndarray:
         """Generate visual representation of field phase"""
-        return np.exp(1j * phase_data)
+        if out is None:
+            return np.exp(1j * phase_data)
+        np.cos(phase_data, out=out.real)
+        np.sin(phase_data, out=out.imag)
+        return out
+
+
+class FieldPyramid:
+    """
+    Multi-resolution view of one field for progressive and zoomed rendering
+    
+    Level 0 renders the whole field at field_resolution; each further level
+    doubles the resolution and splits the field into 2**level x 2**level
+    tiles of field_resolution pixels, up to the source resolution.
+    """
+    
+    def __init__(self, visualizer: MorphicFieldVisualizer, field_data: np.ndarray,
+                 max_cached: int = 256):
+        self.visualizer = visualizer
+        self.field = np.asarray(field_data)
+        if self.field.ndim < 2:
+            raise ValueError("Pyramid rendering needs a field with two spatial axes")
+        self.max_cached = max_cached
+        self._cache: OrderedDict = OrderedDict()
+        
+        base = visualizer.field_resolution
+        finest = min(self.field.shape[-2:])
+        self.levels = max(0, math.floor(math.log2(finest / base))) + 1
+    
+    def progressive(self, mode: str = 'resonance',
+                    max_level: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, np.ndarray]]]:
+        """Yield whole-field renders from the coarsest level to max_level"""
+        top = self.levels - 1 if max_level is None else min(max_level, self.levels - 1)
+        for level in range(top + 1):
+            yield level, self.render_level(mode, level)
+    
+    def render_level(self, mode: str, level: int) -> Dict[str, np.ndarray]:
+        """Whole-field render at a pyramid level"""
+        self._check_level(level)
+        resolution = self.visualizer.field_resolution * 2 ** level
+        return self._cached(('level', mode, level),
+                            lambda: self._render(mode, self.field, resolution))
+    
+    def render_tile(self, mode: str, level: int, row: int, col: int) -> Dict[str, np.ndarray]:
+        """Render one field_resolution tile of a pyramid level"""
+        self._check_level(level)
+        tiles = 2 ** level
+        if not (0 <= row < tiles and 0 <= col < tiles):
+            raise ValueError(f"Tile ({row}, {col}) outside level {level}")
+        
+        def build() -> Dict[str, np.ndarray]:
+            height, width = self.field.shape[-2:]
+            region = self.field[...,
+                                height * row // tiles:height * (row + 1) // tiles,
+                                width * col // tiles:width * (col + 1) // tiles]
+            return self._render(mode, region, self.visualizer.field_resolution)
+        return self._cached(('tile', mode, level, row, col), build)
+    
+    def zoom(self, mode: str, region: Tuple[float, float, float, float],
+             level: Optional[int] = None) -> Dict[Tuple[int, int], Dict[str, np.ndarray]]:
+        """
+        Render only the tiles covering a region of the field
+        
+        Parameters:
+        - region: (top, bottom, left, right) as fractions of the field in [0, 1]
+        - level: Pyramid level; by default the coarsest level at which the
+          region spans at least field_resolution pixels
+        
+        Returns:
+        - Tile renders keyed by (row, col) at the chosen level
+        """
+        top, bottom, left, right = region
+        if not (0 <= top < bottom <= 1 and 0 <= left < right <= 1):
+            raise ValueError(f"Invalid zoom region: {region}")
+        if level is None:
+            extent = max(bottom - top, right - left)
+            level = min(self.levels - 1, max(0, math.ceil(math.log2(1 / extent))))
+        self._check_level(level)
+        
+        tiles = 2 ** level
+        rows = range(int(top * tiles), min(math.ceil(bottom * tiles), tiles))
+        cols = range(int(left * tiles), min(math.ceil(right * tiles), tiles))
+        return {(row, col): self.render_tile(mode, level, row, col)
+                for row in rows for col in cols}
+    
+    def clear(self) -> None:
+        """Discard cached levels and tiles"""
+        self._cache.clear()
+    
+    def _check_level(self, level: int) -> None:
+        if not 0 <= level < self.levels:
+            raise ValueError(f"Level {level} outside pyramid of {self.levels} levels")
+    
+    def _cached(self, key: Tuple, build) -> Dict[str, np.ndarray]:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        rendered = build()
+        self._cache[key] = rendered
+        if len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return rendered
+    
+    def _render(self, mode: str, region: np.ndarray, resolution: int) -> Dict[str, np.ndarray]:
+        return self.visualizer.visualize_field_state(
+            self._resample(region, resolution), mode)
+    
+    @staticmethod
+    def _resample(region: np.ndarray, resolution: int) -> np.ndarray:
+        """Reduce the two spatial axes to at most resolution samples each"""
+        height, width = region.shape[-2:]
+        target_h, target_w = min(height, resolution), min(width, resolution)
+        if height % target_h == 0 and width % target_w == 0:
+            # Block averaging keeps coarse levels faithful to the fine field
+            blocks = region.reshape(region.shape[:-2] + (target_h, height // target_h,
+                                                         target_w, width // target_w))
+            return blocks.mean(axis=(-3, -1))
+        rows = np.linspace(0, height - 1, target_h).round().astype(int)
+        cols = np.linspace(0, width - 1, target_w).round().astype(int)
+        return region[..., rows[:, None], cols]
+
+
+class StreamingFieldRenderer:
+    """Asynchronous frame-budgeted renderer over a live field stream"""
+    
+    OVERFLOW_POLICIES = ('drop', 'coalesce')
+    
+    def __init__(self, visualizer: MorphicFieldVisualizer, mode: str = 'resonance',
+                 frame_budget: float = 1 / 30, overflow: str = 'drop',
+                 latency_window: int = 1024):
+        if mode not in visualizer.visualization_modes:
+            raise ValueError(f"Unknown visualization mode: {mode}")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.visualizer = visualizer
+        self.mode = mode
+        self.frame_budget = frame_budget
+        self.overflow = overflow
+        self.latencies = deque(maxlen=latency_window)
+        self.counters = {'received': 0, 'rendered': 0, 'dropped': 0, 'coalesced': 0}
+        self._buffers: Dict[str, np.ndarray] = {}
+    
+    async def render(self, frames: AsyncIterator[np.ndarray]
+                     ) -> AsyncIterator[Tuple[int, Dict[str, np.ndarray]]]:
+        """
+        Render frames as they arrive, shedding load when behind budget
+        
+        Yields:
+        - (frame index, visualization dict); in 'resonance' mode the
+          intensity and phase maps are reused buffers overwritten by the
+          next frame, so copy them to keep them
+        """
+        pending = deque()
+        arrived = asyncio.Event()
+        finished = False
+        
+        async def receive() -> None:
+            nonlocal finished
+            try:
+                async for frame in frames:
+                    pending.append((self.counters['received'], time.perf_counter(), frame))
+                    self.counters['received'] += 1
+                    arrived.set()
+            finally:
+                finished = True
+                arrived.set()
+        
+        receiver = asyncio.create_task(receive())
+        try:
+            while True:
+                await arrived.wait()
+                arrived.clear()
+                if not pending:
+                    if finished:
+                        break
+                    continue
+                index, arrival, frame = self._take_frames(pending)
+                # Render off the event loop so acquisition keeps flowing
+                output = await asyncio.to_thread(self._render_into_buffers, frame)
+                self.latencies.append(time.perf_counter() - arrival)
+                self.counters['rendered'] += 1
+                if pending or finished:
+                    arrived.set()
+                yield index, output
+            await receiver
+        finally:
+            receiver.cancel()
+    
+    def _take_frames(self, pending: deque) -> Tuple[int, float, np.ndarray]:
+        """Pop the next frame, dropping or coalescing any backlog"""
+        index, arrival, frame = pending.popleft()
+        # A backlog is only shed once the oldest waiting frame is over budget
+        if not pending or time.perf_counter() - arrival <= self.frame_budget:
+            return index, arrival, frame
+        
+        if self.overflow == 'drop':
+            self.counters['dropped'] += len(pending)
+            index, arrival, frame = pending.pop()
+            pending.clear()
+            return index, arrival, frame
+        
+        accumulator = self._buffer('coalesce', frame.shape, np.result_type(frame, float))
+        np.copyto(accumulator, frame)
+        count = 1
+        while pending:
+            index, _, frame = pending.popleft()
+            np.add(accumulator, frame, out=accumulator)
+            count += 1
+        accumulator /= count
+        self.counters['coalesced'] += count - 1
+        # Latency is charged from the oldest frame folded into the average
+        return index, arrival, accumulator
+    
+    def _render_into_buffers(self, frame: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Render one frame into reused buffers where the renderer supports it
+        
+        The resonance renderer writes its intensity and phase maps in place;
+        other outputs come from helpers that return fresh arrays and are
+        passed through uncopied.
+        """
+        frame = np.asarray(frame)
+        intensity = self._buffer('intensity', frame.shape, np.float64)
+        phase = self._buffer('phase', frame.shape, np.float64)
+        np.abs(frame, out=intensity)
+        np.arctan2(np.imag(frame), np.real(frame), out=phase)
+        shared = {'field': frame, 'intensity': intensity, 'phase': phase}
+        
+        render_func = self.visualizer.visualization_modes[self.mode]
+        if self.mode != 'resonance':
+            return render_func(frame)
+        out = {key: self._buffer('output:' + key, frame.shape, np.complex128)
+               for key in ('intensity_map', 'phase_map')}
+        return render_func(frame, shared, out)
+    
+    def _buffer(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """Reusable array, reallocated only when the frame layout changes"""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer
+    
+    def latency_percentiles(self, percentiles: Tuple[float, ...] = (50, 95, 99)
+                            ) -> Dict[str, float]:
+        """Per-frame arrival-to-render latency over the recent window, in seconds"""
+        if not self.latencies:
+            return {f'p{p:g}': float('nan') for p in percentiles}
+        values = np.percentile(np.fromiter(self.latencies, float), percentiles)
+        return {f'p{p:g}': float(v) for p, v in zip(percentiles, values)}
@@ -1,25 +1,144 @@
-import matplotlib.pyplot as plt
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+import numpy as np
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+
+# matplotlib is imported on first use so that importing this module stays cheap
+# and free of GUI side effects in batch workers
+
+
+def _load_pyplot():
+    """Import pyplot for interactive display"""
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _new_headless_figure(figsize, dpi):
+    """Create a Figure bound to the Agg canvas, bypassing pyplot's global state"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def decimate_minmax(states: np.ndarray, pixel_width: int,
+                    chunk_size: int = 1 << 22) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to the min and max sample of each pixel column
+    
+    Every drawn pixel keeps its extremes, so spikes and envelopes look the
+    same as the full-resolution plot. Input is read in chunks, so memory-
+    mapped arrays are never loaded whole.
+    
+    Returns:
+    - (sample indices, values) of at most 2 * pixel_width points
+    """
+    states = np.asarray(states)
+    total = states.shape[0]
+    if total <= 2 * pixel_width:
+        return np.arange(total), states
+    
+    bucket = -(-total // pixel_width)
+    buckets_per_chunk = max(1, chunk_size // bucket)
+    indices, values = [], []
+    for start in range(0, total, bucket * buckets_per_chunk):
+        block = np.asarray(states[start:start + bucket * buckets_per_chunk])
+        full = block.shape[0] // bucket * bucket
+        for rows, offset in ((block[:full].reshape(-1, bucket), start),
+                             (block[full:].reshape(1, -1), start + full)):
+            if rows.size == 0:
+                continue
+            lows, highs = rows.argmin(axis=1), rows.argmax(axis=1)
+            # Emit each bucket's extremes in time order to keep the trace shape
+            pair = np.sort(np.stack([lows, highs], axis=1), axis=1)
+            bases = offset + np.arange(rows.shape[0])[:, None] * rows.shape[1]
+            indices.append((bases + pair).ravel())
+            values.append(np.take_along_axis(rows, pair, axis=1).ravel())
+    return np.concatenate(indices), np.concatenate(values)
+
+
+def decimate_lttb(states: np.ndarray, pixel_width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling to pixel_width points
+    
+    Picks, per bucket, the sample forming the largest triangle with the
+    previous pick and the next bucket's mean; reads one bucket at a time.
+    """
+    states = np.asarray(states)
+    total = states.shape[0]
+    if total <= pixel_width or pixel_width < 3:
+        return np.arange(total), states
+    
+    edges = np.linspace(1, total - 1, pixel_width - 1).astype(np.int64)
+    indices = np.empty(pixel_width, dtype=np.int64)
+    indices[0], indices[-1] = 0, total - 1
+    previous_x, previous_y = 0.0, float(states[0])
+    next_bucket = np.asarray(states[edges[0]:edges[1]], dtype=np.float64)
+    for bucket in range(pixel_width - 2):
+        current = next_bucket
+        if bucket + 2 < edges.size:
+            next_bucket = np.asarray(states[edges[bucket + 1]:edges[bucket + 2]],
+                                     dtype=np.float64)
+            mean_x = (edges[bucket + 1] + edges[bucket + 2] - 1) / 2
+            mean_y = next_bucket.mean()
+        else:
+            mean_x, mean_y = total - 1, float(states[total - 1])
+        xs = np.arange(edges[bucket], edges[bucket + 1])
+        areas = np.abs((previous_x - mean_x) * (current - previous_y)
+                       - (previous_x - xs) * (mean_y - previous_y))
+        pick = int(areas.argmax())
+        indices[bucket + 1] = xs[pick]
+        previous_x, previous_y = float(xs[pick]), float(current[pick])
+    return indices, np.asarray(states[indices])
+
 
 class QuantumStateVisualizer:
     """Specialized visualization for quantum-morphic interactions"""
     
-    def __init__(self):
-        # Initialize any required attributes
-        pass
+    DECIMATION_METHODS = {'minmax': decimate_minmax, 'lttb': decimate_lttb}
+    
+    def __init__(self, headless: bool = False, figsize=(10, 6), dpi: int = 100,
+                 decimation: Optional[str] = 'minmax'):
+        if decimation is not None and decimation not in self.DECIMATION_METHODS:
+            raise ValueError(f"Unknown decimation method: {decimation}")
+        self.headless = headless
+        self.figsize = figsize
+        self.dpi = dpi
+        self.decimation = decimation
+        # Headless figure and line artists, built once and updated per call
+        self._figure = None
+        self._lines = {}
     
-    def visualize(self, quantum_states, morphic_states):
+    def visualize(self, quantum_states, morphic_states,
+                  output: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+                  fmt: str = 'png') -> Optional[bytes]:
         """
         Visualize the quantum-morphic interactions.
         
         Parameters:
         - quantum_states: Array of quantum states
         - morphic_states: Array of morphic states
+        - output: Path or file object to write to; renders headless (Agg)
+        - fmt: Image format for headless rendering
+        
+        Returns:
+        - Encoded image bytes when headless and no output is given
         """
-        plt.figure(figsize=(10, 6))
+        if self.headless or output is not None:
+            return self._render_headless(quantum_states, morphic_states, output, fmt)
+        
+        plt = _load_pyplot()
+        plt.figure(figsize=self.figsize, dpi=self.dpi)
+        pixel_width = int(self.figsize[0] * self.dpi)
         
         # Plot quantum states
         plt.subplot(2, 1, 1)
-        plt.plot(quantum_states, label='Quantum States')
+        plt.plot(*self._plot_points(quantum_states, pixel_width), label='Quantum States')
         plt.title('Quantum States')
         plt.xlabel('Time')
         plt.ylabel('State Value')
@@ -27,7 +146,8 @@ class QuantumStateVisualizer:
         
         # Plot morphic states
         plt.subplot(2, 1, 2)
-        plt.plot(morphic_states, label='Morphic States', color='orange')
+        plt.plot(*self._plot_points(morphic_states, pixel_width),
+                 label='Morphic States', color='orange')
         plt.title('Morphic States')
         plt.xlabel('Time')
         plt.ylabel('State Value')
@@ -35,14 +155,253 @@ class QuantumStateVisualizer:
         
         plt.tight_layout()
         plt.show()
+        return None
+    
+    def _render_headless(self, quantum_states, morphic_states,
+                         output: Optional[Union[str, os.PathLike, BinaryIO]],
+                         fmt: str) -> Optional[bytes]:
+        """Render through the Agg canvas, reusing the figure across calls"""
+        if self._figure is None:
+            self._build_headless_figure()
+        
+        for key, states in (('quantum', quantum_states), ('morphic', morphic_states)):
+            line = self._lines[key]
+            line.set_data(*self._plot_points(states, int(line.axes.bbox.width)))
+            line.axes.relim()
+            line.axes.autoscale_view()
+        
+        if output is not None:
+            self._figure.savefig(output, format=fmt)
+            return None
+        buffer = io.BytesIO()
+        self._figure.savefig(buffer, format=fmt)
+        return buffer.getvalue()
+    
+    def _plot_points(self, states, pixel_width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample positions and values to draw, decimated to the pixel width"""
+        states = np.asarray(states)
+        if self.decimation is None:
+            return np.arange(states.shape[0]), states
+        return self.DECIMATION_METHODS[self.decimation](states, max(pixel_width, 1))
+    
+    def _build_headless_figure(self) -> None:
+        """Lay out the two-panel figure once for headless rendering"""
+        figure = _new_headless_figure(self.figsize, self.dpi)
+        quantum_axes, morphic_axes = figure.subplots(2, 1)
+        
+        self._lines['quantum'], = quantum_axes.plot([], [], label='Quantum States')
+        quantum_axes.set_title('Quantum States')
+        self._lines['morphic'], = morphic_axes.plot([], [], label='Morphic States',
+                                                   color='orange')
+        morphic_axes.set_title('Morphic States')
+        for axes in (quantum_axes, morphic_axes):
+            axes.set_xlabel('Time')
+            axes.set_ylabel('State Value')
+            axes.legend()
+        
+        figure.tight_layout()
+        self._figure = figure
 
-# Example usage
-quantum_states = np.random.rand(100)  # Replace with actual quantum states
-morphic_states = np.random.rand(100)  # Replace with actual morphic states
 
-visualizer = QuantumStateVisualizer()
-visualizer.visualize(quantum_states, morphic_states)
+def benchmark_import_time(repeats: int = 5) -> Dict[str, Any]:
+    """
+    Measure cold import time of this module in fresh interpreters
+    
+    Returns:
+    - Best and mean import seconds, and whether matplotlib was loaded
+    """
+    probe = (
+        "import importlib.util, sys, time\n"
+        "start = time.perf_counter()\n"
+        "spec = importlib.util.spec_from_file_location('visualization_systems', sys.argv[1])\n"
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+        "print(time.perf_counter() - start, 'matplotlib' in sys.modules)\n"
+    )
+    timings, loaded_matplotlib = [], False
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, '-c', probe, os.path.abspath(__file__)],
+                                capture_output=True, text=True, check=True)
+        seconds, loaded = result.stdout.split()
+        timings.append(float(seconds))
+        loaded_matplotlib |= loaded == 'True'
+    return {
+        'best_seconds': min(timings),
+        'mean_seconds': sum(timings) / len(timings),
+        'imports_matplotlib': loaded_matplotlib
+    }
+
+
+class SampleRingBuffer:
+    """Fixed-capacity sample history with zero-copy ordered reads"""
+    
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        # Every sample is stored twice, capacity apart, so the latest window
+        # is always one contiguous slice
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._head = 0
+        self.size = 0
+        self.total = 0
+    
+    def extend(self, samples) -> None:
+        """Append samples, overwriting the oldest once full"""
+        samples = np.asarray(samples, dtype=self._data.dtype).ravel()
+        if samples.size > self.capacity:
+            samples = samples[-self.capacity:]
+        count = samples.size
+        first = min(count, self.capacity - self._head)
+        for offset in (0, self.capacity):
+            self._data[offset + self._head:offset + self._head + first] = samples[:first]
+            self._data[offset:offset + count - first] = samples[first:]
+        self._head = (self._head + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+        self.total += count
+    
+    def view(self) -> np.ndarray:
+        """Stored samples, oldest first, as a view into the buffer"""
+        end = self._head + self.capacity
+        return self._data[end - self.size:end]
+
 
 class CustomizableVisualizer:
     """Visualization system with extensive customization options"""
-    # Placeholder for implementation
\ No newline at end of file
+    
+    def __init__(self, capacity: int = 100_000, refresh_rate: float = 30.0,
+                 figsize=(10, 6), dpi: int = 100, headless: bool = False,
+                 colors: Tuple[str, str] = ('tab:blue', 'orange'),
+                 y_margin: float = 0.25):
+        self.capacity = capacity
+        self.refresh_rate = refresh_rate
+        self.figsize = figsize
+        self.dpi = dpi
+        self.headless = headless
+        self.colors = colors
+        self.y_margin = y_margin
+        self.buffers = {
+            'quantum': SampleRingBuffer(capacity),
+            'morphic': SampleRingBuffer(capacity)
+        }
+        self.stats = {'refreshes': 0, 'skipped': 0, 'full_redraws': 0,
+                      'last_refresh_seconds': 0.0}
+        self._lock = threading.Lock()
+        self._figure = None
+        self._lines = {}
+        self._background = None
+        self._last_refresh = 0.0
+    
+    def append(self, quantum_samples, morphic_samples) -> None:
+        """Ingest new samples; safe to call from an acquisition thread"""
+        with self._lock:
+            self.buffers['quantum'].extend(quantum_samples)
+            self.buffers['morphic'].extend(morphic_samples)
+    
+    def start(self):
+        """Build the live figure and capture its static background"""
+        if self.headless:
+            figure = _new_headless_figure(self.figsize, self.dpi)
+        else:
+            figure = _load_pyplot().figure(figsize=self.figsize, dpi=self.dpi)
+        quantum_axes, morphic_axes = figure.subplots(2, 1)
+        
+        for key, axes, label, color in (
+                ('quantum', quantum_axes, 'Quantum States', self.colors[0]),
+                ('morphic', morphic_axes, 'Morphic States', self.colors[1])):
+            self._lines[key], = axes.plot([], [], label=label, color=color, animated=True)
+            axes.set_title(label)
+            axes.set_xlabel('Samples (latest window)')
+            axes.set_ylabel('State Value')
+            # The window axis never moves, so blits never need to redraw ticks
+            axes.set_xlim(0, self.capacity)
+            axes.set_ylim(-1, 1)
+            axes.legend(loc='upper left')
+        figure.tight_layout()
+        figure.canvas.mpl_connect('draw_event', self._capture_background)
+        self._figure = figure
+        self._full_redraw()
+        if not self.headless:
+            _load_pyplot().show(block=False)
+        return figure
+    
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Redraw the traces if the refresh interval has elapsed
+        
+        Returns:
+        - True when a frame was drawn
+        """
+        if self._figure is None:
+            self.start()
+        now = time.perf_counter()
+        if not force and now - self._last_refresh < 1.0 / self.refresh_rate:
+            self.stats['skipped'] += 1
+            return False
+        
+        with self._lock:
+            points = {key: self._window_points(buffer)
+                      for key, buffer in self.buffers.items()}
+        
+        if self._rescale_needed(points):
+            for key, (xs, ys) in points.items():
+                self._lines[key].set_data(xs, ys)
+            self._full_redraw()
+        else:
+            canvas = self._figure.canvas
+            canvas.restore_region(self._background)
+            for key, (xs, ys) in points.items():
+                line = self._lines[key]
+                line.set_data(xs, ys)
+                line.axes.draw_artist(line)
+            canvas.blit(self._figure.bbox)
+        if not self.headless:
+            self._figure.canvas.flush_events()
+        
+        self._last_refresh = now
+        self.stats['refreshes'] += 1
+        self.stats['last_refresh_seconds'] = time.perf_counter() - now
+        return True
+    
+    def _window_points(self, buffer: SampleRingBuffer) -> Tuple[np.ndarray, np.ndarray]:
+        """Decimated copy of the buffered window, right-aligned on the x axis"""
+        pixel_width = int(self._lines['quantum'].axes.bbox.width) or 1
+        xs, ys = decimate_minmax(buffer.view(), pixel_width)
+        return xs + (self.capacity - buffer.size), np.array(ys)
+    
+    def _rescale_needed(self, points: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> bool:
+        """Grow y-limits with headroom when data leaves them"""
+        rescaled = False
+        for key, (_, ys) in points.items():
+            if ys.size == 0:
+                continue
+            axes = self._lines[key].axes
+            low, high = axes.get_ylim()
+            data_low, data_high = float(ys.min()), float(ys.max())
+            if data_low < low or data_high > high:
+                span = max(data_high - data_low, 1e-12)
+                axes.set_ylim(data_low - self.y_margin * span,
+                              data_high + self.y_margin * span)
+                rescaled = True
+        return rescaled
+    
+    def _full_redraw(self) -> None:
+        """Redraw static artists, recapture the background and draw the traces"""
+        self.stats['full_redraws'] += 1
+        canvas = self._figure.canvas
+        canvas.draw()
+        for line in self._lines.values():
+            line.axes.draw_artist(line)
+        canvas.blit(self._figure.bbox)
+    
+    def _capture_background(self, event=None) -> None:
+        """Snapshot everything except the animated traces after a full draw"""
+        self._background = self._figure.canvas.copy_from_bbox(self._figure.bbox)
+
+
+if __name__ == '__main__':
+    # Example usage
+    quantum_states = np.random.rand(100)  # Replace with actual quantum states
+    morphic_states = np.random.rand(100)  # Replace with actual morphic states
+    
+    visualizer = QuantumStateVisualizer()
+    visualizer.visualize(quantum_states, morphic_states)
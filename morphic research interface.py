@@ -1,32 +1,475 @@
+import hashlib
+import inspect
+import itertools
+import json
+import logging
+import os
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, Union)
+
+import numpy as np
+
+from columnar_store import MorphicColumnStore
+
+logger = logging.getLogger(__name__)
+
+_END_OF_STREAM = object()
+
+
+class _StageFailure:
+    """Carries an exception from a stage thread to the consumer"""
+    
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class StreamingPipeline:
+    """
+    Chunk-streaming stages on their own threads, linked by bounded queues
+    
+    A full queue blocks the stage feeding it, so every stage runs at the
+    pace of the slowest one and at most queue_size chunks wait between any
+    two stages.
+    """
+    
+    def __init__(self, stages: Sequence[Callable[[Any], Any]], queue_size: int = 4):
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive")
+        self.stages = list(stages)
+        self.queue_size = queue_size
+    
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """Feed source through every stage, yielding outputs in order"""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        stop = threading.Event()
+        
+        def put(target: queue.Queue, item: Any) -> bool:
+            # Poll so a stopped pipeline never leaves a thread blocked forever
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce() -> None:
+            try:
+                for chunk in source:
+                    if not put(queues[0], chunk):
+                        return
+                put(queues[0], _END_OF_STREAM)
+            except BaseException as error:
+                put(queues[0], _StageFailure(error))
+        
+        def work(stage: Callable[[Any], Any], inbox: queue.Queue, outbox: queue.Queue) -> None:
+            while True:
+                item = inbox.get()
+                if item is _END_OF_STREAM or isinstance(item, _StageFailure):
+                    put(outbox, item)
+                    return
+                try:
+                    result = stage(item)
+                except BaseException as error:
+                    put(outbox, _StageFailure(error))
+                    return
+                if not put(outbox, result):
+                    return
+        
+        threads = [threading.Thread(target=produce, daemon=True)]
+        threads += [threading.Thread(target=work, args=(stage, queues[i], queues[i + 1]),
+                                     daemon=True)
+                    for i, stage in enumerate(self.stages)]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END_OF_STREAM:
+                    return
+                if isinstance(item, _StageFailure):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+            # Unblock any stage still waiting on input after an early exit
+            for pending in queues:
+                try:
+                    pending.put_nowait(_END_OF_STREAM)
+                except queue.Full:
+                    pass
+
+
+class StageResultCache:
+    """
+    Content-addressed, size-bounded on-disk store for pipeline stage outputs
+    
+    Entries are pickles named by key; an index tracks sizes and last access
+    so the least recently used entries are evicted beyond max_bytes.
+    
+    code_version is folded into every pipeline key and must change whenever
+    code producing cached results changes. By default it hashes this module
+    and the source files defining code_components (the analyzer, data
+    manager and visualizer); pass an explicit version when results also
+    depend on code outside those files.
+    """
+    
+    INDEX_NAME = 'index.json'
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 10 * 2 ** 30,
+                 code_version: Optional[str] = None,
+                 code_components: Iterable[Any] = ()):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.code_version = code_version or self.hash_source_files(code_components)
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+    
+    @staticmethod
+    def hash_source_files(components: Iterable[Any] = ()) -> str:
+        """
+        Digest of this module plus the source files defining each component's class
+        
+        Classes without a readable source file (builtins, or classes defined
+        in a REPL or notebook, whose file is '<stdin>' or '<ipython-input-…>')
+        contribute their qualified name instead.
+        """
+        paths = {os.path.abspath(__file__)}
+        names = set()
+        for component in components:
+            cls = type(component)
+            try:
+                path = os.path.abspath(inspect.getfile(cls))
+            except (TypeError, OSError):
+                path = None
+            if path is not None and os.path.isfile(path):
+                paths.add(path)
+            else:
+                names.add(f"{cls.__module__}.{cls.__qualname__}")
+        digest = hashlib.blake2b(digest_size=8)
+        for path in sorted(paths):
+            with open(path, 'rb') as source:
+                digest.update(source.read())
+        for name in sorted(names):
+            digest.update(name.encode())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stable digest of JSON-serializable key parts"""
+        payload = json.dumps(parts, sort_keys=True, default=repr).encode()
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+    
+    def source_digest(self, data_source: str) -> str:
+        """
+        Content hash of a file or directory tree, memoized on size and mtime
+        
+        The memo holds one entry per path, so a changed file replaces its
+        entry and files gone from a digested directory are pruned.
+        """
+        paths = [data_source]
+        if os.path.isdir(data_source):
+            paths = sorted(os.path.join(root, name)
+                           for root, _, names in os.walk(data_source) for name in names)
+        
+        digest = hashlib.blake2b(digest_size=20)
+        memo = self._index['source_digests']
+        for path in paths:
+            stat = os.stat(path)
+            absolute = os.path.abspath(path)
+            entry = memo.get(absolute)
+            if entry is None or (entry['size'], entry['mtime_ns']) != (stat.st_size,
+                                                                       stat.st_mtime_ns):
+                file_digest = hashlib.blake2b(digest_size=20)
+                with open(path, 'rb') as handle:
+                    for block in iter(lambda: handle.read(1 << 20), b''):
+                        file_digest.update(block)
+                entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                         'digest': file_digest.hexdigest()}
+                with self._lock:
+                    memo[absolute] = entry
+            digest.update(os.path.relpath(path, data_source).encode())
+            digest.update(entry['digest'].encode())
+        
+        if os.path.isdir(data_source):
+            root = os.path.join(os.path.abspath(data_source), '')
+            current = {os.path.abspath(path) for path in paths}
+            with self._lock:
+                for stale in [path for path in memo
+                              if path.startswith(root) and path not in current]:
+                    del memo[stale]
+        return digest.hexdigest()
+    
+    def contains(self, key: str) -> bool:
+        return key in self._index['entries']
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Load an entry and mark it recently used"""
+        with self._lock:
+            entry = self._index['entries'].get(key)
+            if entry is None:
+                return default
+            entry['last_access'] = time.time()
+        try:
+            with open(self._path(key), 'rb') as handle:
+                return pickle.load(handle)
+        except FileNotFoundError:
+            with self._lock:
+                self._index['entries'].pop(key, None)
+            return default
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store an entry, evicting least recently used ones over max_bytes"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary = self._path(key) + f'.{threading.get_ident()}.tmp'
+        with open(temporary, 'wb') as handle:
+            handle.write(payload)
+        os.replace(temporary, self._path(key))
+        with self._lock:
+            self._index['entries'][key] = {'size': len(payload), 'last_access': time.time()}
+            self._evict()
+    
+    def flush(self) -> None:
+        """Persist the index"""
+        with self._lock:
+            temporary = os.path.join(self.cache_dir, self.INDEX_NAME + '.tmp')
+            with open(temporary, 'w') as handle:
+                json.dump(self._index, handle)
+            os.replace(temporary, os.path.join(self.cache_dir, self.INDEX_NAME))
+    
+    def _evict(self) -> None:
+        entries = self._index['entries']
+        total = sum(entry['size'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['last_access']):
+            if total <= self.max_bytes:
+                break
+            total -= entries.pop(key)['size']
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+    
+    def _load_index(self) -> Dict[str, Any]:
+        index = {'entries': {}, 'source_digests': {}}
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_NAME)) as handle:
+                index.update(json.load(handle))
+        except (FileNotFoundError, ValueError):
+            pass
+        # Adopt entries written after the last flush, drop ones deleted since
+        on_disk = {name[:-4] for name in os.listdir(self.cache_dir) if name.endswith('.pkl')}
+        entries = {key: value for key, value in index['entries'].items() if key in on_disk}
+        for key in on_disk - set(entries):
+            stat = os.stat(self._path(key))
+            entries[key] = {'size': stat.st_size, 'last_access': stat.st_mtime}
+        index['entries'] = entries
+        # Drop memo entries written in older formats
+        index['source_digests'] = {path: entry for path, entry in index['source_digests'].items()
+                                   if isinstance(entry, dict)}
+        return index
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+
+class DataManager:
+    """
+    Chunked, memory-mapped access to columnar morphic datasets
+    
+    Sources are MorphicColumnStore directories, which are memory-mapped and
+    read zero-copy, or .npz archives of equal-length columns, which numpy
+    loads into memory one selected column at a time; convert() turns an
+    archive into a store once it outgrows memory. Other formats are rejected.
+    """
+    
+    ARCHIVE_SUFFIX = '.npz'
+    
+    def __init__(self, columns: Optional[Sequence[str]] = None,
+                 time_column: str = 'timestamp',
+                 drop_non_finite: bool = True,
+                 transforms: Optional[Dict[str, Callable[[np.ndarray], np.ndarray]]] = None):
+        # Columns the pipeline reads; None maps every stored column
+        self.columns = list(columns) if columns is not None else None
+        self.time_column = time_column
+        self.drop_non_finite = drop_non_finite
+        # Per-column functions applied to each chunk after row filtering
+        self.transforms = dict(transforms or {})
+    
+    def load_data(self, data_source: str,
+                  time_range: Optional[Tuple[Any, Any]] = None) -> Dict[str, Any]:
+        """Map the selected columns over a time range of a store or archive"""
+        if self._is_store(data_source):
+            return MorphicColumnStore(data_source).read(self.columns, time_range)
+        return self._read_archive(data_source, time_range)
+    
+    def iter_chunks(self, data_source: str, chunk_size: int,
+                    time_range: Optional[Tuple[Any, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield column views of at most chunk_size rows, zero-copy for stores"""
+        if self._is_store(data_source):
+            return MorphicColumnStore(data_source).iter_chunks(
+                self.columns, time_range, max_rows=chunk_size)
+        # Reject bad sources here rather than on first read in a stage thread
+        self._check_archive(data_source)
+        return self._iter_archive(data_source, chunk_size, time_range)
+    
+    def preprocess_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a column chunk, drop rows with non-finite values, apply transforms
+        
+        Only the rows of this chunk are touched: a chunk with nothing to drop
+        and no transforms comes back as the same mapped views, uncopied.
+        """
+        if len({len(values) for values in raw_data.values()}) > 1:
+            raise ValueError("Column lengths differ within a chunk")
+        data = dict(raw_data)
+        if self.drop_non_finite:
+            valid = None
+            for values in data.values():
+                if np.asarray(values).dtype.kind not in 'fc':
+                    continue
+                finite = np.isfinite(values)
+                if finite.ndim > 1:
+                    finite = finite.all(axis=tuple(range(1, finite.ndim)))
+                valid = finite if valid is None else valid & finite
+            if valid is not None and not valid.all():
+                data = {name: values[valid] for name, values in data.items()}
+        for name, transform in self.transforms.items():
+            if name in data:
+                data[name] = transform(data[name])
+        return data
+    
+    def cache_token(self) -> Dict[str, Any]:
+        """Settings that change preprocess_data output, for stage cache keys"""
+        return {
+            'columns': self.columns,
+            'time_column': self.time_column,
+            'drop_non_finite': self.drop_non_finite,
+            'transforms': sorted((name, f"{transform.__module__}.{transform.__qualname__}")
+                                 for name, transform in self.transforms.items())
+        }
+    
+    def convert(self, data_source: str, store_path: str,
+                chunk_rows: int = 1 << 20) -> MorphicColumnStore:
+        """Write every column of an .npz archive to a new MorphicColumnStore"""
+        self._check_archive(data_source)
+        with np.load(data_source) as archive:
+            columns = {name: archive[name] for name in archive.files}
+        return MorphicColumnStore.create(store_path, columns, self.time_column, chunk_rows)
+    
+    @staticmethod
+    def _is_store(data_source: str) -> bool:
+        return os.path.isfile(os.path.join(data_source, MorphicColumnStore.META_NAME))
+    
+    def _check_archive(self, data_source: str) -> None:
+        if not (data_source.endswith(self.ARCHIVE_SUFFIX) and os.path.isfile(data_source)):
+            raise ValueError(f"Unsupported data source {data_source!r}: expected a "
+                             f"MorphicColumnStore directory or an .npz archive")
+    
+    def _read_archive(self, data_source: str,
+                      time_range: Optional[Tuple[Any, Any]]) -> Dict[str, np.ndarray]:
+        """Selected columns of an .npz archive, filtered to an inclusive time range"""
+        self._check_archive(data_source)
+        with np.load(data_source) as archive:
+            columns = self.columns or list(archive.files)
+            unknown = set(columns) - set(archive.files)
+            if unknown:
+                raise ValueError(f"Unknown columns: {sorted(unknown)}")
+            data = {name: archive[name] for name in columns}
+            if time_range is not None:
+                if self.time_column not in archive.files:
+                    raise ValueError(f"Missing time column: {self.time_column}")
+                times = data.get(self.time_column)
+                if times is None:
+                    times = archive[self.time_column]
+                start_time, end_time = time_range
+                selected = (times >= start_time) & (times <= end_time)
+                data = {name: values[selected] for name, values in data.items()}
+        return data
+    
+    def _iter_archive(self, data_source: str, chunk_size: int,
+                      time_range: Optional[Tuple[Any, Any]]) -> Iterator[Dict[str, np.ndarray]]:
+        data = self._read_archive(data_source, time_range)
+        rows = len(next(iter(data.values()))) if data else 0
+        for start in range(0, rows, chunk_size):
+            yield {name: values[start:start + chunk_size] for name, values in data.items()}
+
+
 class MorphicResearchInterface:
     """
     Integration interface for morphic field research tools
     """
-    def __init__(self):
+    # analysis_config sections that only shape the report, never the results
+    REPORT_CONFIG_KEYS = ('report',)
+    
+    def __init__(self, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = 10 * 2 ** 30,
+                 export_executor: Optional[Executor] = None,
+                 export_workers: int = 4,
+                 code_version: Optional[str] = None):
+        """
+        code_version keys the stage cache and must change whenever the
+        preprocessing, analysis or visualization code changes; by default it
+        hashes the source files defining the analyzer, data manager and
+        visualizer, which misses code they import from elsewhere.
+        """
         self.analyzer = RobustMorphicAnalyzer()
         self.visualizer = CustomizableVisualizer()
         self.reporter = ReportGenerator()
         self.data_manager = DataManager()
+        self.cache = StageResultCache(
+            cache_dir, cache_max_bytes, code_version,
+            code_components=(self.analyzer, self.data_manager, self.visualizer)
+        ) if cache_dir else None
+        self.cache_report: Dict[str, str] = {}
+        # Report export runs in the background so analysis never waits on it;
+        # a caller-supplied executor stays the caller's to shut down
+        self._owns_export_executor = export_executor is None
+        self.export_executor = export_executor or ThreadPoolExecutor(
+            max_workers=export_workers, thread_name_prefix='report-export')
+        self._pending_exports: List[Future] = []
+        # (format, exception) for every export that raised
+        self.export_failures: List[Tuple[str, BaseException]] = []
         
     def run_analysis_pipeline(self, 
                             data_source: str,
                             analysis_config: Dict[str, Any],
-                            export_format: str = 'pdf') -> None:
+                            export_format: Union[str, Sequence[str]] = 'pdf',
+                            chunk_size: int = 100_000,
+                            queue_size: int = 4) -> Dict[str, Future]:
         """
         Complete analysis pipeline with integrated tools
-        """
-        # Load and validate data
-        raw_data = self.data_manager.load_data(data_source)
-        processed_data = self.data_manager.preprocess_data(raw_data)
         
-        # Run analysis
-        results = self.analyzer.analyze_morphic_system(
-            processed_data,
-            analysis_config
-        )
+        data_source is a MorphicColumnStore directory or an .npz archive;
+        see DataManager for how each is read.
         
-        # Generate visualizations
-        visualizations = self.visualizer.create_visualization_suite(results)
+        The report is generated once and each requested format is exported
+        concurrently on export_executor; the returned futures (keyed by
+        format) resolve when each export finishes, and the method returns
+        as soon as the exports are queued.
+        
+        Loading, preprocessing and analysis run concurrently on chunks of
+        chunk_size records, with at most queue_size chunks buffered between
+        stages; per-chunk analysis results are folded together as they arrive.
+        With a cache_dir, stage outputs are reused across runs and
+        self.cache_report records whether each stage was a hit, miss or skipped.
+        """
+        if self.cache is None:
+            results = self._analyze_stream(
+                self.data_manager.iter_chunks(data_source, chunk_size),
+                analysis_config, queue_size, preprocess=True)
+            visualizations = self.visualizer.create_visualization_suite(results)
+        else:
+            try:
+                results, visualizations = self._run_cached_stages(
+                    data_source, analysis_config, chunk_size, queue_size)
+            finally:
+                self.cache.flush()
         
         # Generate and export report
         report = self.reporter.generate_report(
@@ -34,4 +477,106 @@ class MorphicResearchInterface:
             visualizations,
             analysis_config
         )
-        self.reporter.export_report(report, format=export_format)
\ No newline at end of file
+        formats = [export_format] if isinstance(export_format, str) else list(export_format)
+        exports = {
+            fmt: self.export_executor.submit(self.reporter.export_report, report, format=fmt)
+            for fmt in formats
+        }
+        for fmt, future in exports.items():
+            future.add_done_callback(
+                lambda done, fmt=fmt: self._record_export_failure(fmt, done))
+        self._pending_exports = [future for future in self._pending_exports
+                                 if not future.done()] + list(exports.values())
+        return exports
+    
+    def wait_for_exports(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued exports finish; False if the timeout expired"""
+        _, not_done = wait(self._pending_exports, timeout=timeout)
+        self._pending_exports = list(not_done)
+        return not not_done
+    
+    def close(self) -> None:
+        """Finish outstanding exports and release the export executor if owned"""
+        if self._owns_export_executor:
+            self.export_executor.shutdown(wait=True)
+        else:
+            wait(self._pending_exports)
+        self._pending_exports = []
+    
+    def _record_export_failure(self, fmt: str, future: Future) -> None:
+        """Done-callback keeping export errors visible without checking every future"""
+        if future.cancelled() or future.exception() is None:
+            return
+        self.export_failures.append((fmt, future.exception()))
+        logger.error("Report export to %s failed", fmt, exc_info=future.exception())
+    
+    def _analyze_stream(self, chunks: Iterable[Any], analysis_config: Dict[str, Any],
+                        queue_size: int, preprocess: bool,
+                        on_preprocessed: Optional[Callable[[int, Any], None]] = None) -> Any:
+        """Run (optionally) preprocessing and analysis over chunks, folding results"""
+        stages = []
+        if preprocess:
+            counter = itertools.count()
+            
+            def preprocess_chunk(chunk: Any) -> Any:
+                processed = self.data_manager.preprocess_data(chunk)
+                if on_preprocessed is not None:
+                    on_preprocessed(next(counter), processed)
+                return processed
+            stages.append(preprocess_chunk)
+        stages.append(lambda chunk: self.analyzer.analyze_morphic_system(chunk, analysis_config))
+        
+        # Load, validate and analyze data chunk by chunk
+        results = None
+        for partial in StreamingPipeline(stages, queue_size=queue_size).run(chunks):
+            results = partial if results is None else self.analyzer.merge_results(results, partial)
+        return results
+    
+    def _run_cached_stages(self, data_source: str, analysis_config: Dict[str, Any],
+                           chunk_size: int, queue_size: int):
+        """Serve preprocessing, analysis and visualization from the cache when possible"""
+        cache = self.cache
+        analysis_subset = {key: value for key, value in analysis_config.items()
+                           if key not in self.REPORT_CONFIG_KEYS}
+        preprocess_key = cache.make_key('preprocess', cache.code_version,
+                                        cache.source_digest(data_source), chunk_size,
+                                        self.data_manager.cache_token())
+        analysis_key = cache.make_key('analysis', preprocess_key, analysis_subset)
+        visualization_key = cache.make_key('visualization', analysis_key)
+        self.cache_report = {}
+        
+        missing = object()
+        results = cache.get(analysis_key, missing)
+        if results is not missing:
+            self.cache_report.update(preprocess='skipped', analysis='hit')
+        else:
+            chunk_count = cache.get(preprocess_key)
+            chunk_keys = [cache.make_key(preprocess_key, index)
+                          for index in range(chunk_count or 0)]
+            if chunk_count is not None and all(map(cache.contains, chunk_keys)):
+                self.cache_report['preprocess'] = 'hit'
+                results = self._analyze_stream(
+                    (cache.get(key) for key in chunk_keys),
+                    analysis_config, queue_size, preprocess=False)
+            else:
+                self.cache_report['preprocess'] = 'miss'
+                stored = []
+                
+                def store(index: int, processed: Any) -> None:
+                    cache.put(cache.make_key(preprocess_key, index), processed)
+                    stored.append(index)
+                results = self._analyze_stream(
+                    self.data_manager.iter_chunks(data_source, chunk_size),
+                    analysis_config, queue_size, preprocess=True, on_preprocessed=store)
+                cache.put(preprocess_key, len(stored))
+            self.cache_report['analysis'] = 'miss'
+            cache.put(analysis_key, results)
+        
+        visualizations = cache.get(visualization_key, missing)
+        if visualizations is missing:
+            self.cache_report['visualization'] = 'miss'
+            visualizations = self.visualizer.create_visualization_suite(results)
+            cache.put(visualization_key, visualizations)
+        else:
+            self.cache_report['visualization'] = 'hit'
+        return results, visualizations
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Process-pool entry points for the hyphen-named analysis modules
+
+Under the spawn and forkserver start methods a worker re-imports every
+function it is sent by module name, which fails for files such as
+tachyonic-dna-interface.py. Workers here live in an importable module and
+load the hyphen-named source they need from its path, once per process.
+"""
+
+import importlib.util
+import os
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Modules loaded by path in this worker process, keyed by absolute path
+_LOADED_MODULES: Dict[str, Any] = {}
+
+# Per-worker views onto the sweep inputs, attached once by attach_sweep_inputs
+_SWEEP_INPUTS: Dict[str, np.ndarray] = {}
+_SWEEP_HANDLES: List[shared_memory.SharedMemory] = []
+_SWEEP_MODULE: Dict[str, Any] = {}
+
+
+def load_module(path: str) -> Any:
+    """Import a Python source file by path, caching it for the process"""
+    path = os.path.abspath(path)
+    if path not in _LOADED_MODULES:
+        name = os.path.splitext(os.path.basename(path))[0].replace('-', '_').replace(' ', '_')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _LOADED_MODULES[path] = module
+    return _LOADED_MODULES[path]
+
+
+def attach_sweep_inputs(model_path: str,
+                        layouts: Dict[str, Tuple[str, Tuple[int, ...], str]]) -> None:
+    """Pool initializer loading the model module and mapping the shared inputs"""
+    _SWEEP_MODULE['module'] = load_module(model_path)
+    for name, (block_name, shape, dtype) in layouts.items():
+        handle = shared_memory.SharedMemory(name=block_name)
+        _SWEEP_HANDLES.append(handle)
+        array = np.ndarray(shape, dtype=dtype, buffer=handle.buf)
+        array.setflags(write=False)
+        _SWEEP_INPUTS[name] = array
+
+
+def run_sweep_point(index: int, parameters: Dict[str, float],
+                    batch_size: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Evaluate one grid point over the shared dataset in batch_size slices"""
+    model = _SWEEP_MODULE['module'].EnhancedSheldrakeResearchModel(**parameters)
+    dna_sequences = _SWEEP_INPUTS['dna_sequences']
+    morphic_fields = _SWEEP_INPUTS['morphic_fields']
+    time_vector = _SWEEP_INPUTS['time_vector']
+    
+    samples = dna_sequences.shape[0]
+    coherence = np.empty(samples)
+    density = np.empty(samples)
+    for start in range(0, samples, batch_size):
+        stop = min(start + batch_size, samples)
+        fields = morphic_fields if morphic_fields.shape[0] == 1 else morphic_fields[start:stop]
+        results = model.quantum_dna_interface_batch(
+            dna_sequences[start:stop], fields, time_vector)
+        coherence[start:stop] = results['temporal_coherence']
+        density[start:stop] = results['information_density']
+    return index, coherence, density
+
+
+# Visualizers rebuilt in this worker process, keyed by their pickled state
+_VISUALIZERS: Dict[Tuple, Any] = {}
+
+
+def render_animation_block(visualizer_state: Tuple[str, str, str, Any, Any], mode: str,
+                           block: np.ndarray, out_path: str, done_path: str,
+                           index: int, start: int) -> int:
+    """
+    Render one animation block with a visualizer rebuilt in this worker
+    
+    visualizer_state is (visualizer module path, class source path, class
+    qualname, compositor weights, compositor blend modes); the rebuilt
+    instance is reused for every block this worker renders.
+    """
+    module_path, class_path, qualname, weights, blend_modes = visualizer_state
+    module = load_module(module_path)
+    if visualizer_state not in _VISUALIZERS:
+        cls = load_module(class_path)
+        for part in qualname.split('.'):
+            cls = getattr(cls, part)
+        visualizer = cls()
+        visualizer.compositor = module.LayerCompositor(weights, blend_modes)
+        _VISUALIZERS[visualizer_state] = visualizer
+    return module._render_animation_block(_VISUALIZERS[visualizer_state], mode, block,
+                                          out_path, done_path, index, start)
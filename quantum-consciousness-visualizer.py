@@ -1,3 +1,76 @@
+import inspect
+import os
+import time
+import tracemalloc
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from process_workers import render_animation_block
+
+
+class LayerCompositor:
+    """In-place weighted blending of visualization layers into one buffer"""
+    
+    BLEND_MODES = ('add', 'multiply', 'screen')
+    
+    def __init__(self, weights: Optional[Sequence[float]] = None,
+                 blend_modes: Optional[Sequence[str]] = None):
+        unknown = set(blend_modes or ()) - set(self.BLEND_MODES)
+        if unknown:
+            raise ValueError(f"Unsupported blend modes: {sorted(unknown)}")
+        self.weights = tuple(weights) if weights is not None else None
+        self.blend_modes = tuple(blend_modes) if blend_modes is not None else None
+        self._scratch: Dict[Tuple, np.ndarray] = {}
+    
+    def compose(self, layers: Sequence[np.ndarray],
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Blend layers onto the first one, accumulating in out
+        
+        With default settings every layer is added at weight 1/len(layers),
+        which reproduces np.mean(layers, axis=0) without stacking the layers.
+        """
+        count = len(layers)
+        weights = self.weights or (1.0 / count,) * count
+        blend_modes = self.blend_modes or ('add',) * count
+        if len(weights) != count or len(blend_modes) != count:
+            raise ValueError(f"Compositor configured for {len(weights)} layers, got {count}")
+        
+        shape = np.broadcast_shapes(*(np.shape(layer) for layer in layers))
+        dtype = np.result_type(*layers, np.float64)
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        np.multiply(layers[0], weights[0], out=out)
+        
+        for layer, weight, mode in zip(layers[1:], weights[1:], blend_modes[1:]):
+            if mode == 'add' and weight == 1:
+                np.add(out, layer, out=out)
+                continue
+            scratch = self._scratch_buffer(shape, dtype)
+            np.multiply(layer, weight, out=scratch)
+            if mode == 'add':
+                np.add(out, scratch, out=out)
+            elif mode == 'multiply':
+                # Opacity-weighted multiply: out * (1 - w + w * layer)
+                scratch += 1 - weight
+                np.multiply(out, scratch, out=out)
+            else:
+                # Screen: 1 - (1 - out)(1 - s) == out * (1 - s) + s
+                np.subtract(1, scratch, out=scratch)
+                np.multiply(out, scratch, out=out)
+                np.subtract(1, scratch, out=scratch)
+                np.add(out, scratch, out=out)
+        return out
+    
+    def _scratch_buffer(self, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """One reusable temporary per frame layout"""
+        key = (shape, np.dtype(dtype).str)
+        if key not in self._scratch:
+            self._scratch[key] = np.empty(shape, dtype=dtype)
+        return self._scratch[key]
+
+
 class QuantumConsciousnessVisualizer:
     """Advanced visualization system for quantum consciousness interfaces"""
     
@@ -13,6 +86,8 @@ class QuantumConsciousnessVisualizer:
             'neural': {'primary': '#4169e1', 'secondary': '#ff6347'},  # Blue-Red neural patterns
             'consciousness': {'primary': '#7fffd4', 'secondary': '#daa520'}  # Aqua-Golden consciousness
         }
+        self.compositor = LayerCompositor()
+        self.animation_stats = {}
     
     def generate_visualization(self, quantum_data: np.ndarray, 
                              mode: str = 'mandala') -> Dict[str, np.ndarray]:
@@ -68,9 +143,10 @@ class QuantumConsciousnessVisualizer:
     
     def _generate_quantum_fields(self, data: np.ndarray) -> np.ndarray:
         """Generate quantum field effects"""
-        field_strength = np.abs(data)
-        field_phase = np.angle(data)
-        return np.exp(1j * field_phase) * field_strength
+        # exp(1j * angle(z)) * abs(z) is z itself; only the complex promotion
+        # of real input remains, and complex input is passed through uncopied
+        data = np.asarray(data)
+        return data.astype(np.result_type(data.dtype, np.complex64), copy=False)
     
     def _integrate_consciousness_patterns(self, data: np.ndarray) -> np.ndarray:
         """Generate consciousness integration patterns"""
@@ -78,14 +154,192 @@ class QuantumConsciousnessVisualizer:
         quantum_coupling = self._compute_quantum_coupling(data)
         return consciousness_state * quantum_coupling
     
-    def _compose_layers(self, *layers: np.ndarray) -> np.ndarray:
+    def _compose_layers(self, *layers: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
         """Compose multiple visualization layers"""
-        return np.mean(layers, axis=0)
-    
-    def animate_quantum_transitions(self, time_series_data: np.ndarray) -> np.ndarray:
-        """Generate animated visualization of quantum state transitions"""
-        frames = []
-        for time_slice in time_series_data:
-            frame = self.generate_visualization(time_slice)
-            frames.append(frame['composite'])
-        return np.array(frames)
+        return self.compositor.compose(layers, out=out)
+    
+    def animate_quantum_transitions(self, time_series_data: np.ndarray,
+                                    mode: str = 'mandala',
+                                    out: Optional[np.ndarray] = None,
+                                    out_path: Optional[str] = None,
+                                    block_size: int = 64,
+                                    workers: int = 1,
+                                    resume: bool = False,
+                                    mp_context: Optional[Any] = None) -> np.ndarray:
+        """
+        Generate animated visualization of quantum state transitions
+        
+        Parameters:
+        - time_series_data: Quantum data with time on the first axis
+        - mode: Visualization mode rendered for every frame
+        - out: Optional preallocated (T, ...) array receiving the composites
+        - out_path: Optional .npy path; composites are written to a memmap and
+          finished blocks are recorded in a '<out_path>.done.npy' sidecar
+        - block_size: Frames per vectorized quantum-field/compositing block
+        - workers: Processes rendering blocks in parallel (requires out_path);
+          workers rebuild the visualizer from its class and compositor settings,
+          so subclasses need a no-argument constructor
+        - resume: Skip blocks an interrupted run on out_path already finished
+        - mp_context: Optional multiprocessing context for the worker pool
+        
+        Returns:
+        - Composite frames of shape (T, ...), written in place; throughput is
+          recorded in self.animation_stats
+        """
+        if mode not in self.visualization_modes:
+            raise ValueError(f"Unsupported visualization mode: {mode}")
+        if workers > 1 and out_path is None:
+            raise ValueError("Parallel animation needs out_path for the shared memmap output")
+        time_series_data = np.asarray(time_series_data)
+        started = time.perf_counter()
+        
+        if out_path is None:
+            out = self._render_frames(time_series_data, mode, out, block_size)
+            rendered = time_series_data.shape[0]
+        else:
+            out, rendered = self._render_frames_tracked(
+                time_series_data, mode, out_path, block_size, workers, resume, mp_context)
+        
+        elapsed = time.perf_counter() - started
+        self.animation_stats = {
+            'frames': rendered,
+            'seconds': elapsed,
+            'frames_per_second': rendered / elapsed if elapsed > 0 else float('inf')
+        }
+        return out
+    
+    def _render_frames(self, time_series_data: np.ndarray, mode: str,
+                       out: Optional[np.ndarray], block_size: int) -> np.ndarray:
+        """Render composites for a run of frames into out, allocating if needed"""
+        render = self.visualization_modes[mode]
+        frame_count = time_series_data.shape[0]
+        
+        for start in range(0, frame_count, block_size):
+            stop = min(start + block_size, frame_count)
+            block = time_series_data[start:stop]
+            # Quantum fields are elementwise, so one call covers the whole block
+            quantum_fields = self._generate_quantum_fields(block)
+            
+            for offset, time_slice in enumerate(block):
+                base_visualization = render(time_slice)
+                consciousness_patterns = self._integrate_consciousness_patterns(time_slice)
+                if out is None:
+                    out = self._allocate_frames(
+                        frame_count, base_visualization, quantum_fields[offset],
+                        consciousness_patterns)
+                # Blend the layers directly into the output slot
+                self._compose_layers(base_visualization, quantum_fields[offset],
+                                     consciousness_patterns, out=out[start + offset])
+        
+        if out is None:
+            out = np.empty((0,) + time_series_data.shape[1:], dtype=time_series_data.dtype)
+        elif isinstance(out, np.memmap):
+            out.flush()
+        return out
+    
+    def _render_frames_tracked(self, time_series_data: np.ndarray, mode: str,
+                               out_path: str, block_size: int, workers: int,
+                               resume: bool,
+                               mp_context: Optional[Any] = None) -> Tuple[np.ndarray, int]:
+        """Render into an .npy memmap block by block, recording finished blocks"""
+        frame_count = time_series_data.shape[0]
+        block_count = -(-frame_count // block_size)
+        done_path = out_path + '.done.npy'
+        first_frame = 0
+        
+        if frame_count == 0:
+            # Nothing to probe; mirror _render_frames' empty result on disk
+            out = np.lib.format.open_memmap(out_path, mode='w+', dtype=time_series_data.dtype,
+                                            shape=time_series_data.shape)
+            np.save(done_path, np.zeros(0, dtype=bool))
+            return out, 0
+        if resume and os.path.exists(out_path) and os.path.exists(done_path):
+            out = np.load(out_path, mmap_mode='r+')
+            done = np.load(done_path, mmap_mode='r+')
+            if out.shape[0] != frame_count or done.shape != (block_count,):
+                raise ValueError("Existing animation output does not match this run")
+        else:
+            # Render the first frame once to learn the composite shape and
+            # dtype, then keep it so block 0 starts at frame 1
+            probe = self.generate_visualization(time_series_data[0], mode)
+            out = self._allocate_frames(
+                frame_count, probe['base_layer'], probe['quantum_fields'],
+                probe['consciousness_patterns'], out_path=out_path)
+            out[0] = probe['composite']
+            done = np.lib.format.open_memmap(done_path, mode='w+', dtype=bool,
+                                             shape=(block_count,))
+            first_frame = 1
+        
+        pending = [(index, max(index * block_size, first_frame),
+                    min((index + 1) * block_size, frame_count))
+                   for index in range(block_count) if not done[index]]
+        rendered = first_frame
+        if workers > 1:
+            # Workers get the class and compositor settings, not this instance
+            visualizer_state = (os.path.abspath(__file__),
+                                os.path.abspath(inspect.getfile(type(self))),
+                                type(self).__qualname__,
+                                self.compositor.weights, self.compositor.blend_modes)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+                futures = [pool.submit(render_animation_block, visualizer_state, mode,
+                                       time_series_data[start:stop], out_path,
+                                       done_path, index, start)
+                           for index, start, stop in pending]
+                for future in as_completed(futures):
+                    rendered += future.result()
+        else:
+            for index, start, stop in pending:
+                rendered += _render_animation_block(
+                    self, mode, time_series_data[start:stop], out_path,
+                    done_path, index, start)
+        return np.load(out_path, mmap_mode='r+'), rendered
+    
+    def _allocate_frames(self, frame_count: int, *layers: np.ndarray,
+                         out_path: Optional[str] = None) -> np.ndarray:
+        """Allocate the (T, ...) composite array, on disk when a path is given"""
+        shape = (frame_count,) + np.broadcast_shapes(*(np.shape(layer) for layer in layers))
+        dtype = np.result_type(*layers, np.float64)
+        if out_path is not None:
+            return np.lib.format.open_memmap(out_path, mode='w+', dtype=dtype, shape=shape)
+        return np.empty(shape, dtype=dtype)
+
+
+def benchmark_compositing_memory(frame_shape: Tuple[int, ...] = (1024, 1024),
+                                 layer_count: int = 3) -> Dict[str, int]:
+    """
+    Peak bytes allocated while compositing one frame, np.mean vs LayerCompositor
+    
+    Output buffers are preallocated for the compositor so the figure reflects
+    the temporaries each approach needs on top of the frame itself.
+    """
+    rng = np.random.default_rng(0)
+    layers = [rng.standard_normal(frame_shape) + 1j * rng.standard_normal(frame_shape)
+              for _ in range(layer_count)]
+    compositor = LayerCompositor()
+    out = np.empty(frame_shape, dtype=np.complex128)
+    compositor.compose(layers, out=out)
+    
+    results = {'frame_bytes': out.nbytes}
+    for label, compose in (('np_mean', lambda: np.mean(layers, axis=0)),
+                           ('compositor', lambda: compositor.compose(layers, out=out))):
+        tracemalloc.start()
+        compose()
+        results[label] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return results
+
+
+def _render_animation_block(visualizer: QuantumConsciousnessVisualizer, mode: str,
+                            block: np.ndarray, out_path: str, done_path: str,
+                            index: int, start: int) -> int:
+    """Render one block of frames into the shared memmap and mark it finished"""
+    out = np.load(out_path, mmap_mode='r+')
+    visualizer._render_frames(block, mode, out[start:start + block.shape[0]],
+                              max(block.shape[0], 1))
+    out.flush()
+    # The block is only marked done after its frames are on disk
+    done = np.load(done_path, mmap_mode='r+')
+    done[index] = True
+    done.flush()
+    return block.shape[0]
@@ -1,11 +1,18 @@
 
 Copy# src/morphic_memory_handler.py
 
+import glob
+import os
+import time
+import tracemalloc
 import numpy as np
-from datetime import datetime
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from columnar_store import MorphicColumnStore
+
 @dataclass
 class MemoryState:
     """Track memory state with consciousness awareness"""
@@ -14,11 +21,239 @@ class MemoryState:
     timestamp: datetime
     energy_level: float
 
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_to_epoch_ns(moment: datetime) -> int:
+    """Exact epoch nanoseconds; naive datetimes are taken as UTC"""
+    epoch = _EPOCH_UTC if moment.tzinfo is not None else _EPOCH
+    return (moment - epoch) // timedelta(microseconds=1) * 1000
+
+
+def _epoch_ns_to_datetime(epoch_ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(epoch_ns) // 1000)
+
+
+class MemoryStateRow:
+    """Lightweight MemoryState-compatible view of one stored record"""
+    
+    __slots__ = ('_records', '_index')
+    
+    def __init__(self, records: np.ndarray, index: int):
+        self._records = records
+        self._index = index
+    
+    @property
+    def strength(self) -> float:
+        return float(self._records['strength'][self._index])
+    
+    @property
+    def coherence(self) -> float:
+        return float(self._records['coherence'][self._index])
+    
+    @property
+    def timestamp(self) -> datetime:
+        return _epoch_ns_to_datetime(self._records['timestamp'][self._index])
+    
+    @property
+    def energy_level(self) -> float:
+        return float(self._records['energy_level'][self._index])
+    
+    def to_memory_state(self) -> MemoryState:
+        return MemoryState(self.strength, self.coherence, self.timestamp, self.energy_level)
+
+
+class MemoryStateStore:
+    """Columnar MemoryState records in one growable NumPy structured array"""
+    
+    DTYPE = np.dtype([
+        ('strength', np.float32),
+        ('coherence', np.float32),
+        ('timestamp', np.int64),  # epoch nanoseconds
+        ('energy_level', np.float32)
+    ])
+    AGGREGATES = {'mean': np.mean, 'min': np.min, 'max': np.max,
+                  'sum': np.sum, 'std': np.std}
+    
+    def __init__(self, capacity: int = 1024):
+        self._records = np.empty(max(capacity, 1), dtype=self.DTYPE)
+        self._size = 0
+        self._sorted = True
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: int) -> MemoryStateRow:
+        if not -self._size <= index < self._size:
+            raise IndexError("MemoryStateStore index out of range")
+        return MemoryStateRow(self.records, index % self._size)
+    
+    def __iter__(self) -> Iterator[MemoryStateRow]:
+        records = self.records
+        return (MemoryStateRow(records, index) for index in range(self._size))
+    
+    @property
+    def records(self) -> np.ndarray:
+        """View of the stored records"""
+        return self._records[:self._size]
+    
+    def append(self, strength, coherence, timestamp, energy_level) -> None:
+        """
+        Vectorized append of equal-length field arrays (or scalars)
+        
+        timestamp accepts int64 epoch nanoseconds, datetime64 values or
+        datetime objects.
+        """
+        timestamps = self._as_epoch_ns(timestamp)
+        count = np.broadcast(np.asarray(strength), np.asarray(coherence),
+                             timestamps, np.asarray(energy_level)).size
+        self._reserve(self._size + count)
+        block = self._records[self._size:self._size + count]
+        block['strength'] = strength
+        block['coherence'] = coherence
+        block['timestamp'] = timestamps
+        block['energy_level'] = energy_level
+        
+        previous = self._records['timestamp'][self._size - 1] if self._size else None
+        if self._sorted and count:
+            self._sorted = bool(np.all(np.diff(block['timestamp']) >= 0) and
+                                (previous is None or block['timestamp'][0] >= previous))
+        self._size += count
+    
+    def extend(self, states: Iterable[MemoryState]) -> None:
+        """Append MemoryState objects"""
+        states = list(states)
+        self.append([state.strength for state in states],
+                    [state.coherence for state in states],
+                    [_datetime_to_epoch_ns(state.timestamp) for state in states],
+                    [state.energy_level for state in states])
+    
+    def time_slice(self, start: Optional[Union[datetime, int]] = None,
+                   end: Optional[Union[datetime, int]] = None) -> np.ndarray:
+        """Records with start <= timestamp < end; a view when appends were in time order"""
+        records = self.records
+        low = -2 ** 63 if start is None else self._as_epoch_ns(start)
+        high = 2 ** 63 - 1 if end is None else self._as_epoch_ns(end)
+        if self._sorted:
+            times = records['timestamp']
+            return records[np.searchsorted(times, low, side='left'):
+                           np.searchsorted(times, high, side='left')]
+        times = records['timestamp']
+        return records[(times >= low) & (times < high)]
+    
+    def aggregate(self, field: str, how: str = 'mean',
+                  start: Optional[Union[datetime, int]] = None,
+                  end: Optional[Union[datetime, int]] = None) -> float:
+        """Reduce one field over a time range, e.g. mean strength in a window"""
+        if how not in self.AGGREGATES:
+            raise ValueError(f"Unsupported aggregate: {how}")
+        values = self.time_slice(start, end)[field]
+        if values.size == 0:
+            return float('nan')
+        reduce = self.AGGREGATES[how]
+        if how in ('mean', 'sum', 'std'):
+            # Accumulate float32 fields in float64 to keep large sums accurate
+            return float(reduce(values, dtype=np.float64))
+        return float(reduce(values))
+    
+    def _reserve(self, size: int) -> None:
+        if size <= self._records.size:
+            return
+        grown = np.empty(max(size, 2 * self._records.size), dtype=self.DTYPE)
+        grown[:self._size] = self._records[:self._size]
+        self._records = grown
+    
+    @staticmethod
+    def _as_epoch_ns(timestamp) -> np.ndarray:
+        if isinstance(timestamp, datetime):
+            return np.int64(_datetime_to_epoch_ns(timestamp))
+        values = np.asarray(timestamp)
+        if values.dtype == object:
+            return np.array([_datetime_to_epoch_ns(value) for value in values.ravel()],
+                            dtype=np.int64).reshape(values.shape)
+        if np.issubdtype(values.dtype, np.datetime64):
+            return values.astype('datetime64[ns]').astype(np.int64)
+        return values.astype(np.int64, copy=False)
+
+
+def benchmark_memory_state_storage(count: int = 1_000_000) -> Dict[str, float]:
+    """Peak bytes to hold count records as MemoryState objects vs MemoryStateStore"""
+    rng = np.random.default_rng(0)
+    values = rng.random((3, count))
+    start = datetime(2024, 1, 1)
+    
+    tracemalloc.start()
+    states = [MemoryState(float(values[0, i]), float(values[1, i]),
+                          start + timedelta(seconds=i), float(values[2, i]))
+              for i in range(count)]
+    dataclass_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del states
+    
+    tracemalloc.start()
+    store = MemoryStateStore(capacity=count)
+    store.append(values[0], values[1],
+                 _datetime_to_epoch_ns(start) + np.arange(count, dtype=np.int64) * 10 ** 9,
+                 values[2])
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    return {
+        'records': count,
+        'dataclass_bytes_per_record': dataclass_bytes / count,
+        'store_bytes_per_record': store_bytes / count
+    }
+
+class MemoryRingBuffer:
+    """Fixed-capacity sample history backed by a single preallocated array"""
+    
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        # Samples are mirrored capacity apart so any recent window is one slice
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def extend(self, samples: np.ndarray) -> None:
+        """Append samples, overwriting the oldest once full"""
+        samples = np.asarray(samples, dtype=self._data.dtype).ravel()[-self.capacity:]
+        count = samples.size
+        first = min(count, self.capacity - self._head)
+        for offset in (0, self.capacity):
+            self._data[offset + self._head:offset + self._head + first] = samples[:first]
+            self._data[offset:offset + count - first] = samples[first:]
+        self._head = (self._head + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+    
+    def tail(self, count: int) -> np.ndarray:
+        """View of the most recent count samples (fewer if not yet filled)"""
+        count = min(count, self._size)
+        end = self._head + self.capacity
+        return self._data[end - count:end]
+    
+    def view(self) -> np.ndarray:
+        """View of every stored sample, oldest first"""
+        return self.tail(self._size)
+    
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+
 class MorphicMemoryHandler:
     """Handle morphic field memory operations"""
     
-    def __init__(self):
-        self.memory_buffer = []
+    def __init__(self, memory_capacity: int = 1 << 16):
+        self.memory_buffer = MemoryRingBuffer(memory_capacity)
+        self.memory_state = MemoryRingBuffer(memory_capacity)
+        self._memory_kernel: Optional[np.ndarray] = None
         self.energy_tracker = EnergyStateTracker()
         self.safety_monitor = ConsciousnessSafetyMonitor()
         
@@ -41,6 +276,106 @@ class MorphicMemoryHandler:
         except Exception as e:
             self._handle_processing_error(e)
             return {}
+    
+    def process_historical_batch(self, past_data: np.ndarray,
+                                 energy_levels: np.ndarray,
+                                 stabilities: np.ndarray) -> Dict[str, Any]:
+        """
+        Gate and process many records of historical data in one pass
+        
+        Parameters:
+        - past_data: Records of shape (records, samples)
+        - energy_levels, stabilities: Per-record energy state
+        
+        Returns:
+        - safe_mask over records, plus memory and field states for the safe
+          records only, in their original order; the safe state when the
+          current energy state is unsafe, as in process_historical_data
+        """
+        try:
+            energy_state = self.energy_tracker.get_current_state()
+            if not self.safety_monitor.is_safe_to_process(energy_state):
+                return self._create_safe_state()
+            
+            past_data = np.atleast_2d(past_data)
+            safe_mask = self.safety_monitor.safe_mask(energy_levels, stabilities)
+            kernel = np.asarray(self._get_memory_kernel(energy_state))
+            memory_state = self._convolve_rows(past_data[safe_mask], kernel)
+            
+            return {
+                'safe_mask': safe_mask,
+                'memory_state': memory_state,
+                'field_state': self._calculate_field_state(memory_state),
+                'timestamp': datetime.now(),
+                'energy_level': np.asarray(energy_levels)[safe_mask]
+            }
+        except Exception as e:
+            self._handle_processing_error(e)
+            return {}
+    
+    @staticmethod
+    def _convolve_rows(rows: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+        """Full np.convolve of every row with kernel via one batched FFT"""
+        length = rows.shape[-1] + kernel.size - 1
+        nfft = 1 << (length - 1).bit_length()
+        if np.iscomplexobj(rows) or np.iscomplexobj(kernel):
+            spectrum = np.fft.fft(rows, nfft, axis=-1) * np.fft.fft(kernel, nfft)
+            return np.fft.ifft(spectrum, axis=-1)[:, :length]
+        spectrum = np.fft.rfft(rows, nfft, axis=-1) * np.fft.rfft(kernel, nfft)
+        return np.fft.irfft(spectrum, nfft, axis=-1)[:, :length]
+    
+    def update_memory(self, new_samples: np.ndarray) -> Dict[str, Any]:
+        """
+        Fold newly arrived samples into the running memory state
+        
+        Only the new samples and a kernel-length tail of history are
+        convolved, so each update costs O(len(new_samples) * kernel) no
+        matter how long the history is. memory_state holds the causal part
+        of the memory convolution over the retained window (a view, not a
+        copy); field_state covers memory_update only, since recomputing it
+        over the whole window would make every update O(capacity).
+        """
+        try:
+            energy_state = self.energy_tracker.get_current_state()
+            if not self.safety_monitor.is_safe_to_process(energy_state):
+                return self._create_safe_state()
+            
+            kernel = np.asarray(self._get_memory_kernel(energy_state), dtype=np.float64)
+            if self._memory_kernel is None or not np.array_equal(kernel, self._memory_kernel):
+                self._rebuild_memory_state(kernel)
+            
+            new_samples = np.asarray(new_samples, dtype=np.float64).ravel()
+            memory_update = np.zeros(0)
+            if new_samples.size:
+                history = self.memory_buffer.tail(kernel.size - 1)
+                # Before the first kernel-length of samples, history is zero-padded
+                lead = np.zeros(kernel.size - 1 - history.size)
+                memory_update = np.convolve(
+                    np.concatenate([lead, history, new_samples]), kernel, mode='valid')
+            self.memory_buffer.extend(new_samples)
+            self.memory_state.extend(memory_update)
+            
+            return {
+                'memory_state': self.memory_state.view(),
+                'memory_update': memory_update,
+                'field_state': (self._calculate_field_state(memory_update)
+                                if memory_update.size else None),
+                'timestamp': datetime.now(),
+                'energy_level': energy_state.current_level
+            }
+        except Exception as e:
+            self._handle_processing_error(e)
+            return {}
+    
+    def _rebuild_memory_state(self, kernel: np.ndarray) -> None:
+        """Recompute memory_state over the retained history for a new kernel"""
+        if kernel.size > self.memory_buffer.capacity:
+            raise ValueError("Memory kernel is longer than the memory buffer")
+        history = self.memory_buffer.view()
+        self.memory_state.clear()
+        if history.size:
+            self.memory_state.extend(np.convolve(history, kernel)[:history.size])
+        self._memory_kernel = kernel.copy()
             
     def _analyze_memory_patterns(self, data: np.ndarray) -> np.ndarray:
         """Analyze patterns with energy awareness"""
@@ -51,6 +386,124 @@ class MorphicMemoryHandler:
 
 # src/morphic_field_propagator.py
 
+class FieldPropagationEngine:
+    """
+    Time-stepped diffusion of a 2-D or 3-D morphic field grid
+    
+    Two backends advance the same field equation du/dt = diffusivity * lap(u):
+    - 'stencil': explicit finite differences on a pair of preallocated buffers
+      that swap roles each step, with fixed (Dirichlet) edges. Large grids
+      can be split into slabs along the first axis and stepped on a thread
+      pool, since numpy releases the GIL inside the ufuncs.
+    - 'spectral': periodic domain; the field is transformed once and each
+      step multiplies the spectrum in place by a precomputed decay factor.
+    
+    Neither backend allocates array memory per step.
+    """
+    
+    def __init__(self, field: np.ndarray, diffusivity: float = 0.1,
+                 backend: str = 'stencil', workers: int = 1,
+                 dtype: Union[type, np.dtype] = np.float64):
+        if field.ndim not in (2, 3):
+            raise ValueError(f"field must be 2-D or 3-D, got {field.ndim}-D")
+        if backend not in ('stencil', 'spectral'):
+            raise ValueError(f"Unknown propagation backend: {backend}")
+        if backend == 'stencil' and not 0 < diffusivity <= 1.0 / (2 * field.ndim):
+            raise ValueError(
+                f"diffusivity must be in (0, {1.0 / (2 * field.ndim)}] for a stable stencil")
+        
+        self.diffusivity = diffusivity
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.steps_taken = 0
+        self.stats: Dict[str, float] = {}
+        self._executor = (ThreadPoolExecutor(max_workers=self.workers)
+                          if backend == 'stencil' and self.workers > 1 else None)
+        
+        if backend == 'stencil':
+            self._front = np.array(field, dtype=dtype)
+            # Edges are never written, so both buffers keep the boundary values
+            self._back = self._front.copy()
+            self._slabs = self._split_interior(field.shape[0], self.workers)
+        else:
+            self._spectrum = np.fft.rfftn(np.asarray(field, dtype=dtype))
+            self._decay = self._spectral_decay(field.shape, diffusivity,
+                                               self._spectrum.dtype)
+            self._shape = field.shape
+    
+    @property
+    def field(self) -> np.ndarray:
+        """Current field state"""
+        if self.backend == 'stencil':
+            return self._front
+        return np.fft.irfftn(self._spectrum, self._shape)
+    
+    def run(self, steps: int) -> Dict[str, float]:
+        """Advance the field by steps and report throughput"""
+        start = time.perf_counter()
+        for _ in range(steps):
+            self.step()
+        elapsed = time.perf_counter() - start
+        
+        cells = self._front.size if self.backend == 'stencil' else int(np.prod(self._shape))
+        self.stats = {
+            'steps': steps,
+            'seconds': elapsed,
+            'cell_updates_per_second': cells * steps / elapsed if elapsed > 0 else float('inf')
+        }
+        return self.stats
+    
+    def step(self):
+        """Advance the field by one time step"""
+        if self.backend == 'spectral':
+            self._spectrum *= self._decay
+        elif self._executor is None:
+            self._stencil_slab(1, self._front.shape[0] - 1)
+            self._front, self._back = self._back, self._front
+        else:
+            list(self._executor.map(lambda slab: self._stencil_slab(*slab), self._slabs))
+            self._front, self._back = self._back, self._front
+        self.steps_taken += 1
+    
+    def close(self):
+        """Shut down the tiling thread pool, if any"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _stencil_slab(self, start: int, stop: int):
+        """Write rows [start, stop) of the back buffer from the front buffer"""
+        front, back = self._front, self._back
+        interior = (slice(1, -1),) * (front.ndim - 1)
+        out = back[(slice(start, stop),) + interior]
+        
+        # u' = a * (sum of neighbours + (1/a - 2d) * u), accumulated in place
+        np.multiply(front[(slice(start, stop),) + interior],
+                    1.0 / self.diffusivity - 2 * front.ndim, out=out)
+        np.add(out, front[(slice(start - 1, stop - 1),) + interior], out=out)
+        np.add(out, front[(slice(start + 1, stop + 1),) + interior], out=out)
+        for axis in range(1, front.ndim):
+            for shift in (slice(None, -2), slice(2, None)):
+                index = list((slice(start, stop),) + interior)
+                index[axis] = shift
+                np.add(out, front[tuple(index)], out=out)
+        out *= self.diffusivity
+    
+    @staticmethod
+    def _split_interior(rows: int, workers: int) -> List[Tuple[int, int]]:
+        """Partition interior rows 1..rows-2 into contiguous slabs"""
+        bounds = np.linspace(1, rows - 1, min(workers, max(rows - 2, 1)) + 1).astype(int)
+        return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    
+    @staticmethod
+    def _spectral_decay(shape: Tuple[int, ...], diffusivity: float,
+                        dtype: np.dtype) -> np.ndarray:
+        """Per-step spectral multiplier matching the discrete Laplacian"""
+        freqs = [np.fft.fftfreq(n) for n in shape[:-1]] + [np.fft.rfftfreq(shape[-1])]
+        grids = np.meshgrid(*freqs, indexing='ij', sparse=True)
+        symbol = sum(2.0 * np.cos(2 * np.pi * f) - 2.0 for f in grids)
+        return np.exp(diffusivity * symbol).astype(dtype)
+
 class MorphicFieldPropagator:
     """Handle morphic field propagation with consciousness safety"""
     
@@ -76,6 +529,64 @@ class MorphicFieldPropagator:
         except Exception as e:
             self._handle_propagation_error(e)
             return np.array([])
+    
+    def propagate_fields(self, field_data: np.ndarray, energy_levels: np.ndarray,
+                         stabilities: np.ndarray) -> Dict[str, np.ndarray]:
+        """Propagate a stack of fields, gated per field by its energy state"""
+        try:
+            if not self.safety_monitor.is_safe_to_propagate():
+                return {'safe_mask': np.zeros(len(field_data), dtype=bool),
+                        'propagation': np.array([])}
+            
+            safe_mask = self.safety_monitor.safe_mask(energy_levels, stabilities)
+            safe_fields = np.asarray(field_data)[safe_mask]
+            # Bridge state and detector are sampled once for the whole batch
+            quantum_state = self.quantum_bridge.get_state()
+            field_strength = self.field_detector.measure_strength(safe_fields)
+            
+            return {
+                'safe_mask': safe_mask,
+                'propagation': self._calculate_propagation(
+                    safe_fields, quantum_state, field_strength)
+            }
+        except Exception as e:
+            self._handle_propagation_error(e)
+            return {'safe_mask': np.zeros(len(field_data), dtype=bool),
+                    'propagation': np.array([])}
+    
+    def simulate_field(self, field_data: np.ndarray, steps: int,
+                       diffusivity: float = 0.1, backend: str = 'stencil',
+                       workers: int = 1) -> Dict[str, Any]:
+        """
+        Evolve a 2-D/3-D field grid over many time steps, then propagate it
+        
+        The bridge state and field strength are sampled once for the final
+        state rather than once per step.
+        
+        Returns:
+        - propagation of the evolved field and the engine throughput stats
+        """
+        try:
+            if not self.safety_monitor.is_safe_to_propagate():
+                return {'propagation': np.array([]), 'stats': {}}
+            
+            engine = FieldPropagationEngine(field_data, diffusivity, backend, workers)
+            try:
+                stats = engine.run(steps)
+                evolved = engine.field
+            finally:
+                engine.close()
+            
+            return {
+                'propagation': self._calculate_propagation(
+                    evolved,
+                    self.quantum_bridge.get_state(),
+                    self.field_detector.measure_strength(evolved)),
+                'stats': stats
+            }
+        except Exception as e:
+            self._handle_propagation_error(e)
+            return {'propagation': np.array([]), 'stats': {}}
 
 # src/sheldrake_data_integrator.py
 
@@ -87,13 +598,15 @@ class SheldrakeDataIntegrator:
         self.field_mapper = FieldMapper()
         self.safety_monitor = ConsciousnessSafetyMonitor()
         
-    def import_historical_data(self, data_path: str, data_type: str) -> Dict[str, Any]:
+    def import_historical_data(self, data_path: str, data_type: str,
+                               columns: Optional[List[str]] = None,
+                               time_range: Optional[Tuple[Any, Any]] = None) -> Dict[str, Any]:
         """Import and process historical data safely"""
         try:
             if not self.safety_monitor.is_safe_to_import():
                 return self._create_safe_import_state()
                 
-            raw_data = self._load_data(data_path)
+            raw_data = self._gate_records(self._load_data(data_path, columns, time_range))
             patterns = self.pattern_analyzer.analyze(raw_data)
             field_map = self.field_mapper.map_fields(patterns)
             
@@ -106,6 +619,112 @@ class SheldrakeDataIntegrator:
         except Exception as e:
             self._handle_import_error(e)
             return {}
+    
+    def import_historical_archive(self, source: str, data_type: str,
+                                  columns: Optional[List[str]] = None,
+                                  time_range: Optional[Tuple[Any, Any]] = None,
+                                  chunk_size: Optional[int] = None,
+                                  workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Import many historical datasets in parallel
+        
+        Parameters:
+        - source: Directory whose subdirectories are datasets, or a glob
+          pattern matching dataset paths
+        - chunk_size: Rows per pattern-analysis chunk; None analyzes each
+          file whole, exactly as import_historical_data would
+        - workers: Size of the thread pool parsing and analyzing files
+        
+        Field maps of chunks, and then of files in path order, are combined
+        with field_mapper.merge_maps, which must be associative; only the
+        mapper knows which of its fields add and which (means, ratios) need
+        weighting, so results with a chunk_size match whole-file results
+        only as far as merge_maps is exact. A file that fails to load,
+        analyze or merge is recorded and the rest of the batch goes on.
+        
+        Returns:
+        - merged field_mapping plus per-file timings and failures
+        """
+        try:
+            if not self.safety_monitor.is_safe_to_import():
+                return self._create_safe_import_state()
+            
+            if os.path.isdir(source):
+                paths = sorted(os.path.join(source, name) for name in os.listdir(source)
+                               if os.path.isdir(os.path.join(source, name)))
+            else:
+                paths = sorted(glob.glob(source))
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                file_results = list(executor.map(
+                    lambda path: self._import_file(path, columns, time_range, chunk_size),
+                    paths))
+        except Exception as e:
+            self._handle_import_error(e)
+            return {}
+        
+        field_map, files, failures = None, {}, {}
+        for result in file_results:
+            if 'error' in result:
+                failures[result['path']] = result['error']
+                continue
+            try:
+                field_map = (result['field_mapping'] if field_map is None else
+                             self.field_mapper.merge_maps(field_map, result['field_mapping']))
+            except Exception as e:
+                failures[result['path']] = f"{type(e).__name__}: {e}"
+                continue
+            files[result['path']] = {key: result[key] for key in ('seconds', 'rows', 'chunks')}
+        
+        return {
+            'field_mapping': field_map if field_map is not None else {},
+            'files': files,
+            'failures': failures,
+            'metadata': self._get_metadata(data_type),
+            'safety_metrics': self.safety_monitor.get_metrics()
+        }
+    
+    def _import_file(self, path: str, columns: Optional[List[str]],
+                     time_range: Optional[Tuple[Any, Any]],
+                     chunk_size: Optional[int]) -> Dict[str, Any]:
+        """Analyze one dataset chunk by chunk; errors are returned, not raised"""
+        start = time.perf_counter()
+        try:
+            if chunk_size is None:
+                pieces = [self._load_data(path, columns, time_range)]
+            else:
+                pieces = MorphicColumnStore(path).iter_chunks(
+                    columns, time_range, max_rows=chunk_size)
+            
+            field_map, rows, chunks = None, 0, 0
+            for chunk in pieces:
+                chunk = self._gate_records(chunk)
+                patterns = self.pattern_analyzer.analyze(chunk)
+                partial = self.field_mapper.map_fields(patterns)
+                field_map = (partial if field_map is None else
+                             self.field_mapper.merge_maps(field_map, partial))
+                rows += len(next(iter(chunk.values()), ()))
+                chunks += 1
+            
+            return {'path': path, 'field_mapping': field_map if field_map is not None else {},
+                    'seconds': time.perf_counter() - start, 'rows': rows, 'chunks': chunks}
+        except Exception as e:
+            return {'path': path, 'error': f"{type(e).__name__}: {e}",
+                    'seconds': time.perf_counter() - start}
+    
+    def _gate_records(self, raw_data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Keep only records whose own energy state is safe, in one vectorized pass"""
+        if 'energy_level' not in raw_data or 'stability' not in raw_data:
+            return raw_data
+        safe_mask = self.safety_monitor.safe_mask(raw_data['energy_level'], raw_data['stability'])
+        if safe_mask.all():
+            return raw_data
+        return {name: values[safe_mask] for name, values in raw_data.items()}
+    
+    def _load_data(self, data_path: str, columns: Optional[List[str]] = None,
+                   time_range: Optional[Tuple[Any, Any]] = None) -> Dict[str, np.ndarray]:
+        """Map only the requested columns and time range of a columnar dataset"""
+        return MorphicColumnStore(data_path).read(columns, time_range)
 
 # src/experimental_interface.py
 
@@ -117,6 +736,7 @@ class ExperimentalInterface:
         self.data_collector = DataCollector()
         self.safety_checker = SafetyChecker()
         self.energy_tracker = EnergyStateTracker()
+        self.safety_monitor = ConsciousnessSafetyMonitor()
         
     def design_experiment(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Design safe morphic field experiment"""
@@ -139,6 +759,28 @@ class ExperimentalInterface:
         except Exception as e:
             self._handle_design_error(e)
             return {}
+    
+    def design_experiments(self, parameter_sets: List[Dict[str, Any]],
+                           energy_states: List[EnergyState]) -> List[Dict[str, Any]]:
+        """Design many experiments, screening energy states in one vectorized pass"""
+        safe_mask = self.safety_monitor.safe_mask_for_states(energy_states)
+        designs = []
+        for parameters, energy_state, safe in zip(parameter_sets, energy_states, safe_mask):
+            if not safe:
+                designs.append(self._create_safe_fallback_state())
+                continue
+            safety_check = self.safety_checker.validate(parameters, energy_state)
+            if not safety_check['is_safe']:
+                designs.append(self._create_safe_fallback_state())
+                continue
+            protocol = self._generate_protocol(parameters)
+            designs.append({
+                'protocol': protocol,
+                'monitoring': self._setup_monitoring(protocol),
+                'safety_metrics': safety_check,
+                'energy_state': energy_state
+            })
+        return designs
 
 # src/safety_monitors.py
 
@@ -155,6 +797,18 @@ class ConsciousnessSafetyMonitor:
             energy_state.current_level > self.energy_minimum and
             energy_state.stability > self.threshold
         )
+    
+    def safe_mask(self, energy_levels: np.ndarray, stabilities: np.ndarray) -> np.ndarray:
+        """Vectorized is_safe_to_process over arrays of levels and stabilities"""
+        return ((np.asarray(energy_levels) > self.energy_minimum) &
+                (np.asarray(stabilities) > self.threshold))
+    
+    def safe_mask_for_states(self, energy_states: List[EnergyState]) -> np.ndarray:
+        """Boolean mask of which EnergyState objects are safe to process"""
+        count = len(energy_states)
+        return self.safe_mask(
+            np.fromiter((state.current_level for state in energy_states), float, count),
+            np.fromiter((state.stability for state in energy_states), float, count))
 
 class EnergyStateTracker:
     """Track energy states for MS-aware processing"""
@@ -1,11 +1,424 @@
+import hashlib
+import itertools
+import math
+import os
+import tempfile
+import time
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, Union)
+
+from process_workers import attach_sweep_inputs, run_sweep_point
+
+ArrayStream = Union[np.ndarray, Iterable[np.ndarray]]
+SpectrumProvider = Callable[[int], np.ndarray]
+
+
+class ConvolutionEngine:
+    """Size-aware convolution backend preserving np.convolve semantics"""
+    
+    BACKENDS = ('auto', 'direct', 'fft', 'overlap_add')
+    
+    def __init__(self, backend: str = 'auto', direct_threshold: int = 64,
+                 overlap_add_ratio: int = 32):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown convolution backend: {backend}")
+        self.backend = backend
+        self.direct_threshold = direct_threshold
+        self.overlap_add_ratio = overlap_add_ratio
+    
+    def convolve(self, signal: np.ndarray, kernel: np.ndarray,
+                 mode: str = 'full',
+                 signal_spectrum: Optional[SpectrumProvider] = None) -> np.ndarray:
+        """
+        Drop-in replacement for np.convolve
+        
+        Parameters:
+        - signal, kernel: 1-D input sequences
+        - mode: 'full', 'same' or 'valid', as in np.convolve
+        - signal_spectrum: Optional callable returning np.fft.fft(signal, nfft),
+          letting callers reuse a cached spectrum on the FFT path
+        
+        Returns:
+        - Convolution with the dtype and length np.convolve would produce
+        """
+        signal = np.asarray(signal)
+        kernel = np.asarray(kernel)
+        if signal.ndim != 1 or kernel.ndim != 1:
+            raise ValueError("ConvolutionEngine expects 1-D inputs")
+        if signal.size == 0 or kernel.size == 0:
+            raise ValueError("Convolution inputs cannot be empty")
+        if mode not in ('full', 'same', 'valid'):
+            raise ValueError(f"Unknown convolution mode: {mode}")
+        
+        backend = self.select_backend(signal.size, kernel.size)
+        if backend == 'direct':
+            return np.convolve(signal, kernel, mode=mode)
+        if backend == 'fft':
+            full = self._fft_convolve(signal, kernel, signal_spectrum)
+        else:
+            full = self._overlap_add_convolve(signal, kernel)
+        return self._trim(full, signal.size, kernel.size, mode)
+    
+    def select_backend(self, n: int, m: int) -> str:
+        """Choose the cheapest backend for inputs of length n and m"""
+        if self.backend != 'auto':
+            return self.backend
+        short, long = min(n, m), max(n, m)
+        if short <= self.direct_threshold:
+            return 'direct'
+        if long >= self.overlap_add_ratio * short:
+            return 'overlap_add'
+        return 'fft'
+    
+    @staticmethod
+    def _trim(full: np.ndarray, n: int, m: int, mode: str) -> np.ndarray:
+        """Cut a full convolution down to np.convolve's 'same'/'valid' window"""
+        if mode == 'full':
+            return full
+        if mode == 'same':
+            start = (min(n, m) - 1) // 2
+            return full[..., start:start + max(n, m)]
+        start = min(n, m) - 1
+        return full[..., start:start + max(n, m) - min(n, m) + 1]
+    
+    @staticmethod
+    def _fft_size(n: int) -> int:
+        """Next power of two at or above n"""
+        return 1 << (int(n) - 1).bit_length()
+    
+    def _fft_convolve(self, signal: np.ndarray, kernel: np.ndarray,
+                      signal_spectrum: Optional[SpectrumProvider] = None) -> np.ndarray:
+        """Full convolution via a zero-padded FFT product along the last axis"""
+        out_len = signal.shape[-1] + kernel.shape[-1] - 1
+        nfft = self._fft_size(out_len)
+        dtype = np.result_type(signal, kernel)
+        if np.iscomplexobj(signal) or np.iscomplexobj(kernel):
+            signal_fft = (signal_spectrum(nfft) if signal_spectrum is not None
+                          else np.fft.fft(signal, nfft))
+            spectrum = signal_fft * np.fft.fft(kernel, nfft)
+            full = np.fft.ifft(spectrum)[..., :out_len]
+        else:
+            spectrum = np.fft.rfft(signal, nfft) * np.fft.rfft(kernel, nfft)
+            full = np.fft.irfft(spectrum, nfft)[..., :out_len]
+        return self._cast(full, dtype)
+    
+    @staticmethod
+    def _cast(full: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Cast an FFT result to np.convolve's dtype, rounding for integer types"""
+        if dtype.kind in 'biu':
+            # Exact sums are integers; truncating FFT round-off would be off by one
+            full = np.rint(full)
+        return full.astype(dtype, copy=False)
+    
+    def _overlap_add_convolve(self, signal: np.ndarray,
+                              kernel: np.ndarray) -> np.ndarray:
+        """Full convolution of a long signal with a short kernel, block by block"""
+        if kernel.size > signal.size:
+            signal, kernel = kernel, signal
+        n, m = signal.size, kernel.size
+        dtype = np.result_type(signal, kernel)
+        is_complex = np.iscomplexobj(signal) or np.iscomplexobj(kernel)
+        
+        # Blocks several kernels long keep the FFT cost per output sample low
+        nfft = self._fft_size(8 * m)
+        block = nfft - m + 1
+        fft, ifft = (np.fft.fft, np.fft.ifft) if is_complex else (np.fft.rfft, np.fft.irfft)
+        kernel_spectrum = fft(kernel, nfft)
+        
+        # Accumulate in floating point and cast once, so integer inputs round
+        full = np.zeros(n + m - 1, dtype=np.complex128 if is_complex else np.float64)
+        for start in range(0, n, block):
+            segment = signal[start:start + block]
+            piece = ifft(fft(segment, nfft) * kernel_spectrum, nfft)
+            stop = min(start + nfft, full.size)
+            full[start:stop] += piece[:stop - start]
+        return self._cast(full, dtype)
+    
+    def convolve_batch(self, signals: np.ndarray, kernels: np.ndarray,
+                       mode: str = 'full',
+                       signal_spectrum: Optional[SpectrumProvider] = None) -> np.ndarray:
+        """
+        Row-wise np.convolve over stacks of sequences
+        
+        Parameters:
+        - signals: Array of shape (batch, n) or a single (n,) sequence
+        - kernels: Array of shape (batch, m) or a single (m,) sequence,
+          broadcast against signals
+        - mode: 'full', 'same' or 'valid', as in np.convolve
+        - signal_spectrum: Optional cached-spectrum callable, as in convolve
+        
+        Returns:
+        - Array of shape (batch, output_length)
+        """
+        signals = np.atleast_2d(signals)
+        kernels = np.atleast_2d(kernels)
+        if signals.ndim != 2 or kernels.ndim != 2:
+            raise ValueError("convolve_batch expects 1-D or 2-D inputs")
+        if mode not in ('full', 'same', 'valid'):
+            raise ValueError(f"Unknown convolution mode: {mode}")
+        n, m = signals.shape[-1], kernels.shape[-1]
+        batch = np.broadcast_shapes(signals.shape[:1], kernels.shape[:1])[0]
+        
+        if self.select_backend(n, m) == 'direct':
+            signals = np.broadcast_to(signals, (batch, n))
+            kernels = np.broadcast_to(kernels, (batch, m))
+            return np.stack([np.convolve(s, k, mode=mode)
+                             for s, k in zip(signals, kernels)])
+        # One batched FFT beats per-row overlap-add for any stacked input
+        full = self._fft_convolve(signals, kernels, signal_spectrum)
+        return self._trim(full, n, m, mode)
+
+
+class OverlapSaveConvolver:
+    """Exact streaming 'same'-mode convolution of a long signal with a fixed kernel"""
+    
+    def __init__(self, kernel: np.ndarray,
+                 engine: Optional[ConvolutionEngine] = None):
+        self.kernel = np.asarray(kernel)
+        if self.kernel.ndim != 1 or self.kernel.size == 0:
+            raise ValueError("Streaming kernel must be a non-empty 1-D array")
+        self.engine = engine or ConvolutionEngine()
+        self._history = None
+        self._pending_skip = (self.kernel.size - 1) // 2
+    
+    def push(self, chunk: np.ndarray) -> np.ndarray:
+        """Consume the next input chunk and return the outputs it completes"""
+        chunk = np.asarray(chunk)
+        if self._history is None:
+            dtype = np.result_type(chunk, self.kernel)
+            self._history = np.zeros(self.kernel.size - 1, dtype=dtype)
+        if chunk.size == 0:
+            return self._history[:0]
+        
+        # Overlap-save: prepend the last kernel-length tail, keep the valid part
+        block = np.concatenate([self._history, chunk])
+        output = self.engine.convolve(block, self.kernel, mode='valid')
+        self._history = block[block.size - self._history.size:]
+        
+        # 'same' mode starts (kernel_length - 1) // 2 samples into the full output
+        dropped = min(self._pending_skip, output.size)
+        self._pending_skip -= dropped
+        return output[dropped:]
+    
+    def flush(self) -> np.ndarray:
+        """Emit the trailing outputs once the input stream is exhausted"""
+        if self._history is None:
+            return np.zeros(0, dtype=self.kernel.dtype)
+        return self.push(np.zeros((self.kernel.size - 1) // 2,
+                                  dtype=self._history.dtype))
+    
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Convolve an iterable of chunks, yielding output as it completes"""
+        for chunk in chunks:
+            output = self.push(chunk)
+            if output.size:
+                yield output
+        yield self.flush()
+
+
+class TachyonFieldCache:
+    """Bounded LRU cache of tachyon fields and their FFT spectra"""
+    
+    def __init__(self, maxsize: int = 32):
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def make_key(time_vector: np.ndarray, *parameters: float) -> Tuple:
+        """Key a time vector by content hash, shape and dtype plus parameters"""
+        time_vector = np.ascontiguousarray(time_vector)
+        digest = hashlib.blake2b(time_vector.view(np.uint8), digest_size=16).hexdigest()
+        return (digest, time_vector.shape, time_vector.dtype.str) + tuple(parameters)
+    
+    def get(self, key: Tuple, build: Callable[[], np.ndarray]) -> Dict[str, Any]:
+        """Return the entry for key, building and inserting it on a miss"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        
+        self.misses += 1
+        field = build()
+        # Cached fields are shared between calls, so guard against mutation
+        field.setflags(write=False)
+        entry = {'field': field, 'spectra': {}}
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+    
+    @staticmethod
+    def spectrum(entry: Dict[str, Any], nfft: int) -> np.ndarray:
+        """Zero-padded FFT of a cached field, computed once per nfft"""
+        spectra = entry['spectra']
+        if nfft not in spectra:
+            spectrum = np.fft.fft(entry['field'], nfft)
+            spectrum.setflags(write=False)
+            spectra[nfft] = spectrum
+        return spectra[nfft]
+    
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def info(self) -> Dict[str, int]:
+        """Hit/miss counters and occupancy"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+
+def iter_chunks(source: ArrayStream, chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Yield fixed-size chunks from an array, memmap or iterable of arrays
+    
+    Arrays are sliced as views so memory-mapped inputs are only paged in
+    chunk by chunk; iterables are re-blocked to chunk_size.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunk_size):
+            yield np.asarray(source[start:start + chunk_size])
+        return
+    
+    buffered, buffered_size = [], 0
+    for piece in source:
+        piece = np.asarray(piece).ravel()
+        buffered.append(piece)
+        buffered_size += piece.size
+        if buffered_size < chunk_size:
+            continue
+        joined = np.concatenate(buffered)
+        full_chunks = joined.size // chunk_size * chunk_size
+        for start in range(0, full_chunks, chunk_size):
+            yield joined[start:start + chunk_size]
+        remainder = joined[full_chunks:]
+        buffered, buffered_size = [remainder], remainder.size
+    if buffered_size:
+        yield np.concatenate(buffered)
+
+
+def spool_chunks(source: ArrayStream, path: str, chunk_size: int) -> np.ndarray:
+    """
+    Write a stream of chunks to a raw file and map it back as one 1-D array
+    
+    Gives iterable inputs the random access out_of_core_fft needs, holding
+    one chunk in memory at a time.
+    """
+    dtype = None
+    with open(path, 'wb') as handle:
+        for chunk in iter_chunks(source, chunk_size):
+            dtype = dtype or chunk.dtype
+            np.ascontiguousarray(chunk, dtype=dtype).tofile(handle)
+    if dtype is None:
+        raise ValueError("Cannot spool an empty stream")
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def out_of_core_fft(source: np.ndarray, out: np.ndarray, scratch_dir: str,
+                    chunk_size: int = 1 << 20) -> np.ndarray:
+    """
+    Four-step FFT of a 1-D array into out, touching chunk_size-sized blocks
+    
+    With N = N1 * N2 the sequence is viewed as an (N1, N2) matrix: FFTs
+    down the columns, a twiddle multiply, FFTs along the rows, then a
+    transposed write so out[k1 + N1 * k2] holds row k1, column k2. source
+    and out may be np.memmap; the intermediate matrix lives in a scratch
+    memmap under scratch_dir. N1 is the largest divisor of N not above
+    sqrt(N), so memory stays near chunk_size for lengths with such a
+    divisor; a prime length degenerates to a single in-memory row.
+    
+    Matches np.fft.fft(source) to floating-point rounding.
+    """
+    n = source.shape[0]
+    if source.ndim != 1 or out.shape != (n,):
+        raise ValueError("out_of_core_fft expects 1-D source and out of equal length")
+    n1 = next(d for d in range(math.isqrt(n), 0, -1) if n % d == 0)
+    n2 = n // n1
+    
+    matrix = source.reshape(n1, n2)
+    work = np.lib.format.open_memmap(
+        os.path.join(scratch_dir, f'fft-{id(out):x}.npy'), mode='w+',
+        dtype=np.complex128, shape=(n1, n2))
+    k1 = np.arange(n1)[:, None]
+    
+    width = max(1, chunk_size // n1)
+    for start in range(0, n2, width):
+        columns = np.arange(start, min(start + width, n2))
+        block = np.fft.fft(matrix[:, start:start + width], axis=0)
+        # Reduce k1 * n2 modulo N before scaling so large N keeps its precision
+        block *= np.exp(-2j * np.pi * ((k1 * columns) % n) / n)
+        work[:, start:start + width] = block
+    
+    transposed = out.reshape(n2, n1)
+    height = max(1, chunk_size // n2)
+    for start in range(0, n1, height):
+        transposed[:, start:start + height] = np.fft.fft(
+            work[start:start + height], axis=1).T
+    
+    del work
+    return out
+
+
+def benchmark_convolution_backends(signal_lengths: tuple = (1_000, 10_000, 100_000),
+                                   kernel_lengths: tuple = (16, 256, 4_096),
+                                   repeats: int = 3) -> List[Dict[str, float]]:
+    """
+    Time each convolution backend across input sizes to locate crossovers
+    
+    Returns:
+    - One record per (signal, kernel) pair with the best time per backend
+      and the backend 'auto' would select
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for n in signal_lengths:
+        for m in kernel_lengths:
+            if m > n:
+                continue
+            signal = rng.standard_normal(n)
+            kernel = rng.standard_normal(m)
+            record = {'signal_length': n, 'kernel_length': m,
+                      'auto_choice': ConvolutionEngine().select_backend(n, m)}
+            for backend in ConvolutionEngine.BACKENDS[1:]:
+                engine = ConvolutionEngine(backend)
+                timings = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    engine.convolve(signal, kernel, mode='same')
+                    timings.append(time.perf_counter() - start)
+                record[backend] = min(timings)
+            results.append(record)
+    return results
+
+
 class EnhancedSheldrakeResearchModel:
     """Extended implementation incorporating tachyonic DNA interface"""
     
     def __init__(self, lambda_e: float = 0.1, lambda_m: float = 0.5, 
-                 tachyon_coupling: float = 0.1):
+                 tachyon_coupling: float = 0.1,
+                 convolution_backend: str = 'auto',
+                 field_cache_size: int = 32):
         self.lambda_e = lambda_e
         self.lambda_m = lambda_m
         self.tachyon_coupling = tachyon_coupling
+        self.convolution_engine = ConvolutionEngine(convolution_backend)
+        self.tachyon_cache = TachyonFieldCache(field_cache_size)
         self.metadata = {
             "version": "2.0.0",
             "research_use": "Authorized research implementation",
@@ -30,9 +443,10 @@ class EnhancedSheldrakeResearchModel:
         base_frequency = 2 * np.pi * np.fft.fft(dna_sequence)
         
         # Compute tachyonic coupling
-        tachyon_field = self._generate_tachyon_field(time_vector)
-        coupling_strength = self.tachyon_coupling * np.convolve(
-            tachyon_field, morphic_field, mode='same')
+        tachyon_entry = self._tachyon_entry(time_vector)
+        coupling_strength = self.tachyon_coupling * self.convolution_engine.convolve(
+            tachyon_entry['field'], morphic_field, mode='same',
+            signal_spectrum=lambda nfft: self.tachyon_cache.spectrum(tachyon_entry, nfft))
         
         # Calculate quantum states
         quantum_states = self._compute_quantum_states(
@@ -49,10 +463,182 @@ class EnhancedSheldrakeResearchModel:
             'information_density': self._compute_information_density(morphic_data)
         }
     
+    def quantum_dna_interface_batch(self, dna_sequences: np.ndarray,
+                                    morphic_fields: np.ndarray,
+                                    time_vector: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized quantum_dna_interface over a stack of samples
+        
+        Parameters:
+        - dna_sequences: Normalized DNA sequences, shape (batch, length)
+        - morphic_fields: Morphic field vectors, shape (batch, length) or a
+          single (length,) field shared by every sample
+        - time_vector: Temporal evolution parameters shared by the batch
+        
+        Returns:
+        - Same keys as quantum_dna_interface, with a leading batch axis on
+          every entry
+        """
+        dna_sequences = np.atleast_2d(dna_sequences)
+        morphic_fields = np.atleast_2d(morphic_fields)
+        
+        base_frequency = 2 * np.pi * np.fft.fft(dna_sequences, axis=-1)
+        
+        # The tachyon field depends only on time, so it is built once per batch
+        tachyon_entry = self._tachyon_entry(time_vector)
+        coupling_strength = self.tachyon_coupling * self.convolution_engine.convolve_batch(
+            tachyon_entry['field'], morphic_fields, mode='same',
+            signal_spectrum=lambda nfft: self.tachyon_cache.spectrum(tachyon_entry, nfft))
+        
+        quantum_states = self._compute_quantum_states(
+            base_frequency, coupling_strength)
+        morphic_data = self.convolution_engine.convolve_batch(
+            quantum_states, morphic_fields, mode='same')
+        
+        return {
+            'quantum_states': quantum_states,
+            'resonance_patterns': self._extract_resonance_patterns(morphic_data),
+            'temporal_coherence': self._calculate_coherence(quantum_states),
+            'information_density': self._compute_information_density(morphic_data)
+        }
+    
+    def quantum_dna_interface_stream(self, dna_sequence: ArrayStream,
+                                     morphic_field: ArrayStream,
+                                     time_vector: np.ndarray,
+                                     decoding_kernel: np.ndarray,
+                                     chunk_size: int = 1 << 16,
+                                     out: Optional[Dict[str, np.ndarray]] = None,
+                                     dna_spectrum: Optional[np.ndarray] = None,
+                                     scratch_dir: Optional[str] = None
+                                     ) -> Dict[str, Any]:
+        """
+        Chunked quantum_dna_interface for sequences larger than memory
+        
+        Parameters:
+        - dna_sequence: Normalized DNA data as an array, memmap or iterable
+          of chunks
+        - morphic_field: Morphic field strength, streamed alongside the DNA
+        - time_vector: Temporal evolution parameters; the tachyon field built
+          from it is the coupling kernel and must be no longer than the DNA
+        - decoding_kernel: Bounded morphic field window used to decode the
+          quantum states, standing in for the whole-field convolution
+        - chunk_size: Samples per processing block
+        - out: Optional preallocated arrays (e.g. np.memmap) under
+          'quantum_states' and 'resonance_patterns' to receive the outputs
+        - dna_spectrum: Optional precomputed np.fft.fft(dna_sequence), e.g. a
+          memmap; computed with out_of_core_fft when omitted
+        - scratch_dir: Directory for temporary memmaps (system default if None)
+        
+        Returns:
+        - temporal_coherence and information_density from running
+          accumulators, plus the arrays passed in through out
+        
+        Both convolutions are exact across chunk boundaries (overlap-save),
+        and resonance frequencies and patterns are whole-sequence spectra
+        formed out of core, so results do not depend on chunk_size. With
+        decoding_kernel equal to morphic_field the result matches
+        quantum_dna_interface.
+        """
+        out = out or {}
+        with tempfile.TemporaryDirectory(dir=scratch_dir) as scratch:
+            if dna_spectrum is None:
+                if not (isinstance(dna_sequence, np.ndarray) and dna_sequence.ndim == 1
+                        and dna_sequence.flags.c_contiguous):
+                    dna_sequence = spool_chunks(
+                        dna_sequence, os.path.join(scratch, 'dna.raw'), chunk_size)
+                dna_spectrum = out_of_core_fft(
+                    dna_sequence,
+                    np.lib.format.open_memmap(os.path.join(scratch, 'dna-spectrum.npy'),
+                                              mode='w+', dtype=np.complex128,
+                                              shape=dna_sequence.shape),
+                    scratch, chunk_size)
+            return self._stream_quantum_states(
+                dna_spectrum, morphic_field, time_vector, decoding_kernel,
+                chunk_size, out, scratch)
+    
+    def _stream_quantum_states(self, dna_spectrum: np.ndarray,
+                               morphic_field: ArrayStream,
+                               time_vector: np.ndarray,
+                               decoding_kernel: np.ndarray, chunk_size: int,
+                               out: Dict[str, np.ndarray],
+                               scratch: str) -> Dict[str, Any]:
+        """Streaming body of quantum_dna_interface_stream over a DNA spectrum"""
+        coupling = OverlapSaveConvolver(
+            self._generate_tachyon_field(time_vector), self.convolution_engine)
+        decoder = OverlapSaveConvolver(decoding_kernel, self.convolution_engine)
+        coupling_chunks = iter_chunks(
+            coupling.stream(iter_chunks(morphic_field, chunk_size)), chunk_size)
+        
+        accumulators = {'abs_sum': 0.0, 'count': 0}
+        
+        def quantum_state_chunks() -> Iterator[np.ndarray]:
+            offset = 0
+            for coupling_chunk in coupling_chunks:
+                base_frequency = 2 * np.pi * np.asarray(
+                    dna_spectrum[offset:offset + coupling_chunk.size])
+                if base_frequency.size != coupling_chunk.size:
+                    raise ValueError("DNA sequence and morphic field lengths differ")
+                quantum_states = self._compute_quantum_states(
+                    base_frequency, self.tachyon_coupling * coupling_chunk)
+                accumulators['abs_sum'] += np.sum(np.abs(quantum_states))
+                accumulators['count'] += quantum_states.size
+                if 'quantum_states' in out:
+                    out['quantum_states'][offset:offset + quantum_states.size] = quantum_states
+                offset += quantum_states.size
+                yield quantum_states
+            if offset != dna_spectrum.shape[0]:
+                raise ValueError("DNA sequence and morphic field lengths differ")
+        
+        information_density = 0.0
+        morphic_path = os.path.join(scratch, 'morphic.raw')
+        with open(morphic_path, 'wb') as morphic_file:
+            for morphic_data in iter_chunks(decoder.stream(quantum_state_chunks()), chunk_size):
+                # Entropy-style density is a plain sum, so it accumulates exactly
+                information_density += self._compute_information_density(morphic_data)
+                if 'resonance_patterns' in out:
+                    np.ascontiguousarray(morphic_data, dtype=np.complex128).tofile(morphic_file)
+        
+        if not accumulators['count']:
+            raise ValueError("Cannot stream an empty DNA sequence")
+        if 'resonance_patterns' in out:
+            # Patterns are the magnitude of the whole-sequence spectrum
+            morphic_data = np.memmap(morphic_path, dtype=np.complex128, mode='r')
+            spectrum = out_of_core_fft(
+                morphic_data,
+                np.lib.format.open_memmap(os.path.join(scratch, 'morphic-spectrum.npy'),
+                                          mode='w+', dtype=np.complex128,
+                                          shape=morphic_data.shape),
+                scratch, chunk_size)
+            for start in range(0, spectrum.shape[0], chunk_size):
+                out['resonance_patterns'][start:start + chunk_size] = np.abs(
+                    spectrum[start:start + chunk_size])
+        return {
+            **out,
+            'temporal_coherence': accumulators['abs_sum'] / accumulators['count'],
+            'information_density': information_density
+        }
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Report tachyon field cache hits, misses and occupancy"""
+        return self.tachyon_cache.info()
+    
+    def _tachyon_entry(self, time_vector: np.ndarray) -> Dict[str, Any]:
+        """Cached tachyon field and spectra for the current parameters"""
+        # Parameters are part of the key, so edits on the instance never hit
+        # entries built under the old values
+        key = self.tachyon_cache.make_key(
+            time_vector, self.lambda_e, self.tachyon_coupling)
+        return self.tachyon_cache.get(
+            key, lambda: self._build_tachyon_field(time_vector))
+    
     def _generate_tachyon_field(self, time_vector: np.ndarray) -> np.ndarray:
         """Generate tachyonic field patterns"""
+        return self._tachyon_entry(time_vector)['field']
+    
+    def _build_tachyon_field(self, time_vector: np.ndarray) -> np.ndarray:
+        """Evaluate the tachyonic field without consulting the cache"""
         # Implementation of tachyonic field generation
-        omega = 2 * np.pi * time_vector
+        omega = 2 * np.pi * np.asarray(time_vector)
         return np.exp(-1j * omega) * self.lambda_e
     
     def _compute_quantum_states(self, frequencies: np.ndarray, 
@@ -63,16 +649,106 @@ class EnhancedSheldrakeResearchModel:
     def _process_morphic_information(self, quantum_states: np.ndarray, 
                                    morphic_field: np.ndarray) -> np.ndarray:
         """Process and decode morphic field information"""
-        return np.convolve(quantum_states, morphic_field, mode='same')
+        return self.convolution_engine.convolve(
+            quantum_states, morphic_field, mode='same')
     
     def _extract_resonance_patterns(self, morphic_data: np.ndarray) -> np.ndarray:
         """Extract coherent resonance patterns from morphic data"""
-        return np.abs(np.fft.fft(morphic_data))
+        return np.abs(np.fft.fft(morphic_data, axis=-1))
     
     def _calculate_coherence(self, quantum_states: np.ndarray) -> float:
         """Calculate quantum coherence of the system"""
-        return np.mean(np.abs(quantum_states))
+        return np.mean(np.abs(quantum_states), axis=-1)
     
     def _compute_information_density(self, morphic_data: np.ndarray) -> float:
         """Compute information density in morphic patterns"""
-        return -np.sum(np.abs(morphic_data) * np.log(np.abs(morphic_data) + 1e-10))
+        magnitude = np.abs(morphic_data)
+        return -np.sum(magnitude * np.log(magnitude + 1e-10), axis=-1)
+
+
+class ParameterSweep:
+    """
+    Process-parallel grid sweep of EnhancedSheldrakeResearchModel parameters
+    
+    Workers run process_workers.run_sweep_point, which loads this file by
+    path, so the sweep works under fork, spawn and forkserver alike.
+    """
+    
+    PARAMETERS = ('lambda_e', 'lambda_m', 'tachyon_coupling')
+    
+    def __init__(self, max_workers: Optional[int] = None, batch_size: int = 256,
+                 mp_context: Optional[Any] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.mp_context = mp_context
+    
+    def expand_grid(self, parameter_grid: Dict[str, Sequence[float]]) -> np.ndarray:
+        """Cartesian product of the grid as a structured parameter table"""
+        unknown = set(parameter_grid) - set(self.PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+        names = [name for name in self.PARAMETERS if name in parameter_grid]
+        points = list(itertools.product(*(parameter_grid[name] for name in names)))
+        table = np.empty(len(points), dtype=[(name, np.float64) for name in names])
+        for row, values in enumerate(points):
+            table[row] = values
+        return table
+    
+    def run(self, parameter_grid: Dict[str, Sequence[float]],
+            dna_sequences: np.ndarray, morphic_fields: np.ndarray,
+            time_vector: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every grid point on the dataset across a process pool
+        
+        Parameters:
+        - parameter_grid: Values per model parameter; omitted parameters keep
+          the model defaults
+        - dna_sequences: Dataset of shape (samples, length)
+        - morphic_fields: Fields of shape (samples, length) or one shared field
+        - time_vector: Temporal evolution parameters shared by the dataset
+        
+        Returns:
+        - 'parameters' table plus (points, samples) arrays of
+          temporal_coherence and information_density
+        """
+        parameters = self.expand_grid(parameter_grid)
+        inputs = {
+            'dna_sequences': np.atleast_2d(dna_sequences),
+            'morphic_fields': np.atleast_2d(morphic_fields),
+            'time_vector': np.asarray(time_vector)
+        }
+        samples = inputs['dna_sequences'].shape[0]
+        results = {
+            'parameters': parameters,
+            'temporal_coherence': np.full((parameters.size, samples), np.nan),
+            'information_density': np.full((parameters.size, samples), np.nan)
+        }
+        
+        # Inputs are copied once into shared memory; workers map them read-only
+        blocks, layouts = [], {}
+        try:
+            for name, array in inputs.items():
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                layouts[name] = (block.name, array.shape, array.dtype.str)
+            
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     mp_context=self.mp_context,
+                                     initializer=attach_sweep_inputs,
+                                     initargs=(os.path.abspath(__file__), layouts)) as pool:
+                futures = [
+                    pool.submit(run_sweep_point, index,
+                                dict(zip(parameters.dtype.names, point.tolist())),
+                                self.batch_size)
+                    for index, point in enumerate(parameters)
+                ]
+                for future in as_completed(futures):
+                    index, coherence, density = future.result()
+                    results['temporal_coherence'][index] = coherence
+                    results['information_density'][index] = density
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return results
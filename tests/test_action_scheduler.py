@@ -0,0 +1,35 @@
+import importlib.util
+import os
+import threading
+import time
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'enhanced-resonance-feedback.py')
+_spec = importlib.util.spec_from_file_location('enhanced_resonance_feedback', _MODULE_PATH)
+feedback = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(feedback)
+
+
+def test_mean_wait_averages_over_started_actions_only():
+    scheduler = feedback.ActionScheduler(max_workers=1)
+    release = threading.Event()
+    blocker = scheduler.submit(release.wait, args=(5,))
+    queued = scheduler.submit(lambda: None)
+    cancelled = [scheduler.submit(lambda: None) for _ in range(2)]
+    for future in cancelled:
+        assert future.cancel()
+    time.sleep(0.05)
+
+    running = scheduler.metrics()
+    release.set()
+    blocker.result(timeout=5)
+    queued.result(timeout=5)
+    scheduler.shutdown()
+    finished = scheduler.metrics()
+
+    assert running['started'] == 1
+    assert running['completed'] == 0
+    assert running['mean_wait'] <= running['max_wait']
+    assert finished['started'] == finished['completed'] == 2
+    # Cancelled entries waited longest; counting them would push the mean past the max
+    assert 0 < finished['mean_wait'] <= finished['max_wait']
@@ -0,0 +1,120 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'tachyonic-dna-interface.py')
+_spec = importlib.util.spec_from_file_location('tachyonic_dna_interface', _MODULE_PATH)
+tachyonic = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tachyonic)
+
+BACKENDS = ('direct', 'fft', 'overlap_add', 'auto')
+MODES = ('full', 'same', 'valid')
+# (signal length, kernel length): n > m, n < m, equal, and long-vs-short
+# sizes that make 'auto' pick each of its backends
+SIZES = [(200, 7), (7, 200), (50, 50), (3000, 80), (80, 3000), (1, 1), (513, 129)]
+
+
+def _random(rng, size, dtype):
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'b':
+        return rng.integers(0, 2, size).astype(bool)
+    if dtype.kind in 'iu':
+        # Small non-negative integers, as in integer-encoded DNA
+        return rng.integers(0, 4, size).astype(dtype)
+    values = rng.standard_normal(size)
+    if dtype.kind == 'c':
+        values = values + 1j * rng.standard_normal(size)
+    return values.astype(dtype)
+
+
+def _assert_matches(result, expected):
+    assert result.shape == expected.shape
+    assert result.dtype == expected.dtype
+    if expected.dtype.kind in 'biu':
+        np.testing.assert_array_equal(result, expected)
+    else:
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('mode', MODES)
+@pytest.mark.parametrize('n, m', SIZES)
+@pytest.mark.parametrize('signal_dtype, kernel_dtype', [
+    (np.float64, np.float64), (np.complex128, np.float64), (np.float64, np.complex128),
+    (np.complex128, np.complex128), (np.int64, np.int64), (np.int32, np.int64),
+    (np.uint8, np.uint8), (np.bool_, np.bool_), (np.int64, np.float64),
+])
+def test_convolve_matches_np_convolve(backend, mode, n, m, signal_dtype, kernel_dtype):
+    rng = np.random.default_rng(n * 7919 + m)
+    signal = _random(rng, n, signal_dtype)
+    kernel = _random(rng, m, kernel_dtype)
+
+    expected = np.convolve(signal, kernel, mode=mode)
+    result = tachyonic.ConvolutionEngine(backend).convolve(signal, kernel, mode=mode)
+
+    _assert_matches(result, expected)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_convolve_rounds_long_integer_sequences(backend):
+    rng = np.random.default_rng(7)
+    signal = rng.integers(0, 4, 5000)
+    kernel = rng.integers(0, 4, 300)
+
+    result = tachyonic.ConvolutionEngine(backend).convolve(signal, kernel, mode='same')
+
+    _assert_matches(result, np.convolve(signal, kernel, mode='same'))
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('mode', MODES)
+def test_convolve_batch_matches_rowwise_np_convolve(backend, mode):
+    rng = np.random.default_rng(0)
+    signals = _random(rng, (4, 300), np.complex128)
+    kernel = _random(rng, 40, np.float64)
+
+    result = tachyonic.ConvolutionEngine(backend).convolve_batch(signals, kernel, mode=mode)
+    expected = np.stack([np.convolve(row, kernel, mode=mode) for row in signals])
+
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_convolve_batch_rounds_integer_inputs(backend):
+    rng = np.random.default_rng(3)
+    signals = _random(rng, (3, 2000), np.int64)
+    kernel = _random(rng, 150, np.int64)
+
+    result = tachyonic.ConvolutionEngine(backend).convolve_batch(signals, kernel, mode='same')
+    expected = np.stack([np.convolve(row, kernel, mode='same') for row in signals])
+
+    _assert_matches(result, expected)
+
+
+def test_convolve_reuses_cached_spectrum():
+    rng = np.random.default_rng(1)
+    signal = _random(rng, 400, np.complex128)
+    kernel = _random(rng, 300, np.complex128)
+    calls = []
+
+    def spectrum(nfft):
+        calls.append(nfft)
+        return np.fft.fft(signal, nfft)
+
+    result = tachyonic.ConvolutionEngine('fft').convolve(signal, kernel, signal_spectrum=spectrum)
+
+    assert calls
+    np.testing.assert_allclose(result, np.convolve(signal, kernel), rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('signal, kernel, mode', [
+    (np.ones((2, 3)), np.ones(3), 'full'),
+    (np.array([]), np.ones(3), 'full'),
+    (np.ones(3), np.ones(3), 'middle'),
+])
+def test_convolve_rejects_invalid_input(signal, kernel, mode):
+    with pytest.raises(ValueError):
+        tachyonic.ConvolutionEngine().convolve(signal, kernel, mode=mode)
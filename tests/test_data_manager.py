@@ -0,0 +1,113 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'morphic research interface.py')
+_spec = importlib.util.spec_from_file_location('morphic_research_interface', _MODULE_PATH)
+research = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(research)
+
+ROWS = 1000
+
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(4)
+    field = rng.standard_normal((ROWS, 3))
+    field[[10, 500]] = np.nan
+    return {'timestamp': np.arange(ROWS, dtype=np.int64),
+            'field': field,
+            'label': rng.integers(0, 5, ROWS)}
+
+
+@pytest.fixture
+def store_path(tmp_path, columns):
+    path = str(tmp_path / 'store')
+    research.MorphicColumnStore.create(path, columns, chunk_rows=300)
+    return path
+
+
+@pytest.fixture
+def archive_path(tmp_path, columns):
+    path = str(tmp_path / 'data.npz')
+    np.savez(path, **columns)
+    return path
+
+
+def _collect(manager, source, chunk_size, time_range=None):
+    chunks = [manager.preprocess_data(chunk)
+              for chunk in manager.iter_chunks(source, chunk_size, time_range)]
+    return {name: np.concatenate([chunk[name] for chunk in chunks])
+            for name in chunks[0]}
+
+
+def test_preprocess_drops_non_finite_rows(store_path, columns):
+    data = _collect(research.DataManager(), store_path, 128)
+
+    keep = np.isfinite(columns['field']).all(axis=1)
+    assert len(data['timestamp']) == ROWS - 2
+    np.testing.assert_array_equal(data['timestamp'], columns['timestamp'][keep])
+    np.testing.assert_array_equal(data['label'], columns['label'][keep])
+
+
+def test_preprocess_passes_clean_chunks_through_uncopied(store_path):
+    manager = research.DataManager()
+    chunk = next(manager.iter_chunks(store_path, 5))
+
+    processed = manager.preprocess_data(chunk)
+
+    assert all(processed[name] is chunk[name] for name in chunk)
+
+
+def test_preprocess_applies_transforms(store_path, columns):
+    manager = research.DataManager(columns=['timestamp', 'label'], drop_non_finite=False,
+                                   transforms={'label': lambda values: values * 2})
+
+    data = _collect(manager, store_path, 256)
+
+    assert set(data) == {'timestamp', 'label'}
+    np.testing.assert_array_equal(data['label'], columns['label'] * 2)
+
+
+def test_archive_source_matches_store(store_path, archive_path):
+    manager = research.DataManager()
+
+    from_store = _collect(manager, store_path, 100, time_range=(50, 649))
+    from_archive = _collect(manager, archive_path, 100, time_range=(50, 649))
+
+    assert set(from_store) == set(from_archive)
+    for name in from_store:
+        np.testing.assert_array_equal(from_archive[name], from_store[name])
+
+
+def test_convert_writes_a_store(tmp_path, archive_path, columns):
+    store = research.DataManager().convert(archive_path, str(tmp_path / 'converted'))
+
+    assert store.length == ROWS
+    np.testing.assert_array_equal(store.read(['label'])['label'], columns['label'])
+
+
+@pytest.mark.parametrize('name', ['data.csv', 'missing.npz', 'directory'])
+def test_unsupported_sources_are_rejected(tmp_path, name):
+    source = tmp_path / name
+    if name == 'directory':
+        source.mkdir()
+    elif name.endswith('.csv'):
+        source.write_text('timestamp\n1\n')
+
+    with pytest.raises(ValueError, match='MorphicColumnStore directory or an .npz'):
+        research.DataManager().iter_chunks(str(source), 10)
+
+
+def test_cache_token_is_stable_across_instances():
+    def scale(values):
+        return values
+
+    first = research.DataManager(transforms={'field': scale}).cache_token()
+
+    assert research.StageResultCache.make_key(first) == research.StageResultCache.make_key(
+        research.DataManager(transforms={'field': scale}).cache_token())
+    assert first != research.DataManager(drop_non_finite=False).cache_token()
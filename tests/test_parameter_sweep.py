@@ -0,0 +1,39 @@
+import importlib.util
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'tachyonic-dna-interface.py')
+_spec = importlib.util.spec_from_file_location('tachyonic_dna_interface', _MODULE_PATH)
+tachyonic = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tachyonic)
+
+GRID = {'lambda_e': [0.5, 1.0], 'tachyon_coupling': [0.1, 0.3]}
+
+
+@pytest.mark.parametrize('start_method', [
+    method for method in ('fork', 'spawn', 'forkserver')
+    if method in multiprocessing.get_all_start_methods()
+])
+def test_sweep_matches_in_process_models(start_method):
+    rng = np.random.default_rng(5)
+    dna = rng.random((3, 64))
+    morphic = rng.random(64)
+    time_vector = np.linspace(0, 1, 16)
+    sweep = tachyonic.ParameterSweep(max_workers=2, batch_size=2,
+                                     mp_context=multiprocessing.get_context(start_method))
+
+    results = sweep.run(GRID, dna, morphic, time_vector)
+
+    assert results['parameters'].size == 4
+    for index, point in enumerate(results['parameters']):
+        model = tachyonic.EnhancedSheldrakeResearchModel(
+            **dict(zip(point.dtype.names, point.tolist())))
+        expected = model.quantum_dna_interface_batch(dna, morphic[np.newaxis], time_vector)
+        np.testing.assert_allclose(results['temporal_coherence'][index],
+                                   expected['temporal_coherence'])
+        np.testing.assert_allclose(results['information_density'][index],
+                                   expected['information_density'])
@@ -0,0 +1,94 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'tachyonic-dna-interface.py')
+_spec = importlib.util.spec_from_file_location('tachyonic_dna_interface', _MODULE_PATH)
+tachyonic = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tachyonic)
+
+LENGTH = 3000
+CHUNK_SIZES = (137, 1000, 2000, 5000)
+
+
+@pytest.fixture(scope='module')
+def inputs():
+    rng = np.random.default_rng(11)
+    dna = rng.random(LENGTH)
+    morphic = rng.random(LENGTH)
+    time_vector = np.linspace(0, 1, 200)
+    model = tachyonic.EnhancedSheldrakeResearchModel()
+    return model, dna, morphic, time_vector, model.quantum_dna_interface(dna, morphic, time_vector)
+
+
+def _stream(model, dna, morphic, time_vector, chunk_size, tmp_path, decoding_kernel):
+    out = {'quantum_states': np.zeros(LENGTH, dtype=complex),
+           'resonance_patterns': np.zeros(LENGTH)}
+    result = model.quantum_dna_interface_stream(
+        dna, morphic, time_vector, decoding_kernel=decoding_kernel,
+        chunk_size=chunk_size, out=out, scratch_dir=str(tmp_path))
+    return result, out
+
+
+def _assert_matches_in_memory(result, out, expected):
+    np.testing.assert_allclose(out['quantum_states'], expected['quantum_states'],
+                               rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(out['resonance_patterns'], expected['resonance_patterns'],
+                               rtol=1e-9, atol=1e-9)
+    assert result['temporal_coherence'] == pytest.approx(expected['temporal_coherence'])
+    assert result['information_density'] == pytest.approx(expected['information_density'])
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_stream_of_arrays_matches_in_memory(inputs, chunk_size, tmp_path):
+    model, dna, morphic, time_vector, expected = inputs
+
+    result, out = _stream(model, dna, morphic, time_vector, chunk_size, tmp_path, morphic)
+
+    _assert_matches_in_memory(result, out, expected)
+
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_stream_of_iterables_matches_in_memory(inputs, chunk_size, tmp_path):
+    model, dna, morphic, time_vector, expected = inputs
+
+    # Uneven pieces exercise re-blocking and spooling to disk
+    result, out = _stream(model, iter(np.array_split(dna, 7)),
+                          iter(np.array_split(morphic, 5)),
+                          time_vector, chunk_size, tmp_path, morphic)
+
+    _assert_matches_in_memory(result, out, expected)
+
+
+def test_stream_of_memmaps_matches_in_memory(inputs, tmp_path):
+    model, dna, morphic, time_vector, expected = inputs
+    dna_map = np.lib.format.open_memmap(str(tmp_path / 'dna.npy'), mode='w+',
+                                        dtype=dna.dtype, shape=dna.shape)
+    dna_map[:] = dna
+
+    result, out = _stream(model, dna_map, morphic, time_vector, 256, tmp_path, morphic)
+
+    _assert_matches_in_memory(result, out, expected)
+
+
+def test_stream_rejects_mismatched_lengths(inputs, tmp_path):
+    model, dna, morphic, time_vector, _ = inputs
+
+    with pytest.raises(ValueError):
+        model.quantum_dna_interface_stream(
+            dna, morphic[:-10], time_vector, decoding_kernel=morphic,
+            chunk_size=500, scratch_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize('length', (1, 12, 997, 4096, 30030))
+def test_out_of_core_fft_matches_numpy(length, tmp_path):
+    rng = np.random.default_rng(length)
+    source = rng.standard_normal(length) + 1j * rng.standard_normal(length)
+    out = np.zeros(length, dtype=complex)
+
+    tachyonic.out_of_core_fft(source, out, str(tmp_path), chunk_size=64)
+
+    np.testing.assert_allclose(out, np.fft.fft(source), rtol=1e-9, atol=1e-8)
@@ -0,0 +1,82 @@
+import importlib.util
+import os
+import tracemalloc
+
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'enhanced-resonance-feedback.py')
+_spec = importlib.util.spec_from_file_location('enhanced_resonance_feedback', _MODULE_PATH)
+feedback = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(feedback)
+
+
+class Target:
+    def run(self, size=1000):
+        return [0] * size
+
+
+@pytest.fixture(autouse=True)
+def no_tracing():
+    assert not tracemalloc.is_tracing()
+    yield
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+        pytest.fail("tracemalloc left running")
+
+
+def test_disable_stops_tracing_started_by_enable():
+    instrumentation = feedback.StageInstrumentation(track_allocations=True)
+
+    instrumentation.enable()
+    assert tracemalloc.is_tracing()
+    instrumentation.disable()
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_disable_leaves_tracing_started_elsewhere():
+    tracemalloc.start()
+    instrumentation = feedback.StageInstrumentation(track_allocations=True)
+
+    instrumentation.enable().disable()
+
+    assert tracemalloc.is_tracing()
+    tracemalloc.stop()
+
+
+def test_switching_on_allocation_tracking_while_enabled_reattaches():
+    target = Target()
+    instrumentation = feedback.StageInstrumentation().instrument(target, 'run').enable()
+    target.run()
+    assert 'run' not in instrumentation.allocations
+
+    instrumentation.set_track_allocations(True)
+    target.run()
+
+    assert tracemalloc.is_tracing()
+    assert instrumentation.allocations['run'] > 0
+    assert instrumentation.counters['run'] == 2
+    instrumentation.disable()
+
+
+def test_instrumenting_a_method_twice_registers_it_once():
+    target = Target()
+    instrumentation = feedback.StageInstrumentation()
+
+    instrumentation.instrument(target, 'run').instrument(target, 'run', stage='renamed')
+    instrumentation.enable()
+    target.run()
+    instrumentation.disable()
+
+    assert len(instrumentation._targets) == 1
+    assert instrumentation.counters == {'renamed': 1}
+    assert 'run' not in target.__dict__
+
+
+def test_benchmark_reports_every_variant():
+    results = feedback.benchmark_instrumentation_overhead(calls=5, repeats=2)
+
+    assert set(results) == {'bare_ns', 'disabled_ns', 'enabled_ns', 'tracked_ns',
+                            'enabled_overhead', 'tracked_overhead', 'wrapper_ns'}
+    assert results['wrapper_ns'] >= 0
@@ -0,0 +1,48 @@
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'morphic research interface.py')
+_spec = importlib.util.spec_from_file_location('morphic_research_interface', _MODULE_PATH)
+research = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(research)
+
+
+@pytest.fixture
+def repl_class(monkeypatch):
+    """A class whose module reports a pseudo-file, as REPL and notebook code does"""
+    def make(name, filename):
+        session = types.ModuleType('repl_session')
+        session.__file__ = filename
+        monkeypatch.setitem(sys.modules, 'repl_session', session)
+        return type(name, (), {'__module__': 'repl_session'})
+    return make
+
+
+@pytest.mark.parametrize('filename', ['<stdin>', '<ipython-input-3-0123456789ab>'])
+def test_hash_source_files_falls_back_to_qualified_name(repl_class, filename):
+    digest = research.StageResultCache.hash_source_files([repl_class('Mapper', filename)()])
+
+    assert digest != research.StageResultCache.hash_source_files()
+    assert digest == research.StageResultCache.hash_source_files(
+        [repl_class('Mapper', filename)()])
+    assert digest != research.StageResultCache.hash_source_files(
+        [repl_class('Visualizer', filename)()])
+
+
+def test_hash_source_files_reads_component_source(tmp_path, monkeypatch):
+    path = tmp_path / 'component.py'
+    path.write_text('class Component:\n    pass\n')
+    spec = importlib.util.spec_from_file_location('component', str(path))
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, 'component', module)
+    spec.loader.exec_module(module)
+
+    before = research.StageResultCache.hash_source_files([module.Component()])
+    path.write_text('class Component:\n    version = 2\n')
+
+    assert research.StageResultCache.hash_source_files([module.Component()]) != before
@@ -0,0 +1,71 @@
+import importlib.util
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+                            'quantum-consciousness-visualizer.py')
+_spec = importlib.util.spec_from_file_location('quantum_consciousness_visualizer', _MODULE_PATH)
+visualizer_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(visualizer_module)
+
+START_METHODS = [method for method in ('fork', 'spawn', 'forkserver')
+                 if method in multiprocessing.get_all_start_methods()]
+
+
+class StubVisualizer(visualizer_module.QuantumConsciousnessVisualizer):
+    """Fills in the render helpers with cheap elementwise layers"""
+    
+    def __init__(self):
+        super().__init__()
+        self.rendered = 0
+    
+    def _render_quantum_mandala(self, data):
+        self.rendered += 1
+        return np.abs(data) ** 2
+    
+    def _integrate_consciousness_patterns(self, data):
+        return np.cos(np.real(data))
+
+
+@pytest.fixture
+def frames():
+    rng = np.random.default_rng(2)
+    return rng.standard_normal((10, 4, 3)) + 1j * rng.standard_normal((10, 4, 3))
+
+
+def test_tracked_animation_renders_each_frame_once(frames, tmp_path):
+    visualizer = StubVisualizer()
+    expected = StubVisualizer().animate_quantum_transitions(frames)
+
+    out = visualizer.animate_quantum_transitions(frames, out_path=str(tmp_path / 'a.npy'),
+                                                 block_size=3)
+
+    np.testing.assert_allclose(out, expected)
+    assert visualizer.rendered == frames.shape[0]
+    assert visualizer.animation_stats['frames'] == frames.shape[0]
+
+
+@pytest.mark.parametrize('start_method', START_METHODS)
+def test_parallel_animation_matches_in_process(frames, tmp_path, start_method):
+    visualizer = StubVisualizer()
+    visualizer.compositor = visualizer_module.LayerCompositor(
+        weights=(0.5, 0.3, 0.2), blend_modes=('add', 'screen', 'multiply'))
+    expected = visualizer.animate_quantum_transitions(frames)
+
+    out = visualizer.animate_quantum_transitions(
+        frames, out_path=str(tmp_path / 'a.npy'), block_size=1, workers=2,
+        mp_context=multiprocessing.get_context(start_method))
+
+    np.testing.assert_allclose(out, expected)
+    assert np.load(str(tmp_path / 'a.npy.done.npy')).all()
+
+
+def test_tracked_animation_of_no_frames(tmp_path):
+    empty = np.zeros((0, 4, 3), dtype=complex)
+
+    out = StubVisualizer().animate_quantum_transitions(empty, out_path=str(tmp_path / 'a.npy'))
+
+    assert out.shape == empty.shape